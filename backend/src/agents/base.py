@@ -23,12 +23,15 @@ Usage:
     ...         pass
 """
 
+import asyncio
+import copy
+import itertools
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Generic, List, Optional, TypeVar
-from uuid import uuid4
+from typing import Any, ClassVar, Dict, Generic, List, Optional, Sequence, Tuple, TypeVar
 from uuid import uuid4
 
 
@@ -39,6 +42,10 @@ from uuid import uuid4
 InputT = TypeVar("InputT")   # Agent input type
 OutputT = TypeVar("OutputT") # Agent output type
 
+# Process-local sequence for default agent IDs. These only tag in-process
+# instances, so a counter is enough; next() is atomic under the GIL.
+_agent_id_counter = itertools.count()
+
 
 # =============================================================================
 # ENUMS
@@ -59,7 +66,40 @@ class AgentStatus(str, Enum):
 # CORE DATA CONTRACTS
 # =============================================================================
 
-@dataclass(frozen=True)
+class ReasoningTrace:
+    """
+    Raw reasoning steps recorded during a single agent run.
+    
+    Steps are stored as (ns_offset, message, args) tuples, where ns_offset is
+    measured from the start of the run on the monotonic perf counter. Message
+    formatting and ISO timestamps are only produced when render() is called,
+    so runs whose trace is never inspected pay for a tuple append per step.
+    """
+    
+    __slots__ = ("started_at_ns", "steps")
+    
+    def __init__(self, started_at_ns: int, steps: List[Tuple[int, str, tuple]]):
+        self.started_at_ns = started_at_ns  # Wall-clock epoch ns at run start
+        self.steps = steps
+    
+    def __len__(self) -> int:
+        return len(self.steps)
+    
+    def render(self) -> List[Dict[str, str]]:
+        """Format steps as {"timestamp", "message"} dicts."""
+        rendered = []
+        for offset_ns, message, args in self.steps:
+            timestamp = datetime.fromtimestamp(
+                (self.started_at_ns + offset_ns) / 1e9, tz=timezone.utc
+            )
+            rendered.append({
+                "timestamp": timestamp.isoformat(),
+                "message": message % args if args else message,
+            })
+        return rendered
+
+
+@dataclass(frozen=True, slots=True)
 class AgentResponse(Generic[OutputT]):
     """
     Standardized response returned by every agent.
@@ -78,9 +118,13 @@ class AgentResponse(Generic[OutputT]):
             - <0.5 = Low confidence (requires human review)
         explanation: Human-readable reasoning for the output
         metadata: Optional diagnostics (timing, model info, debug data)
+        timestamp: When the response was produced (timezone-aware UTC)
+        audit_trail: Reasoning steps logged during the run, rendered on to_dict()
     
     Design Notes:
         - frozen=True makes this immutable (hashable, thread-safe)
+        - slots=True drops the per-instance __dict__; one response is
+          created per agent call, so this adds up over large batches
         - Generic[OutputT] enables type-safe output access
         - All fields have sensible defaults except agent_name and status
     
@@ -99,6 +143,8 @@ class AgentResponse(Generic[OutputT]):
     confidence_score: float = 0.0
     explanation: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    audit_trail: Optional[ReasoningTrace] = None
     
     def __post_init__(self) -> None:
         """Validate invariants after initialization."""
@@ -129,6 +175,8 @@ class AgentResponse(Generic[OutputT]):
             "confidence_score": self.confidence_score,
             "explanation": self.explanation,
             "metadata": self.metadata,
+            "timestamp": self.timestamp.isoformat(),
+            "audit_trail": self.audit_trail.render() if self.audit_trail else [],
         }
 
 
@@ -372,24 +420,129 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
     name: str = "base_agent"  # Unique agent identifier
     description: str = "Base agent - must be overridden"  # What this agent does
     
+    # Static instructions for LLM-backed agents. Providers cache prompts by
+    # prefix, so this must be identical across calls: never interpolate
+    # timestamps, agent_id, candidate data or anything else per-request.
+    # All dynamic content goes in the user message via _build_messages().
+    SYSTEM_PROMPT: ClassVar[str] = ""
+    
+    # Concrete class name, resolved once per subclass in __init_subclass__
+    agent_type: ClassVar[str] = "BaseAgent"
+    
+    # Reasoning traces cost a clock read and an append per step. High-throughput
+    # runs that never read audit_trail can set this False (on the class or a
+    # subclass) to make log_reasoning a no-op.
+    audit_enabled: ClassVar[bool] = True
+    
+    # Agents whose reasoning trace is a compliance record set this True;
+    # audit_enabled is then ignored and the trace is always kept.
+    audit_required: ClassVar[bool] = False
+    
     # -------------------------------------------------------------------------
     # Initialization
     # -------------------------------------------------------------------------
     
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.agent_type = cls.__name__
+        if cls.audit_required and not cls.__dict__.get("audit_enabled", True):
+            raise TypeError(f"{cls.__name__} requires auditing and cannot set audit_enabled = False")
+    
     def __init__(self, agent_id: Optional[str] = None):
         """
         Initialize the agent with optional ID.
         
         Args:
             agent_id: Unique identifier for this agent instance.
-                     If not provided, generates a UUID.
+                     If not provided, one is generated on first access.
+        """
+        self._agent_id = agent_id or None
+        self._reasoning_log: List[Tuple[int, str, tuple]] = []
+        self._run_started_ns = time.perf_counter_ns()
+        self._run_started_at_ns = time.time_ns()
+        if not self.audit_enabled and not self.audit_required:
+            # Bind the no-op directly so callers skip even the flag check
+            self.log_reasoning = self._skip_reasoning  # type: ignore[method-assign]
+    
+    @property
+    def agent_id(self) -> str:
+        """Instance identifier, generated lazily as <agent_type>_<seq>."""
+        if self._agent_id is None:
+            self._agent_id = f"{self.agent_type}_{next(_agent_id_counter):08x}"
+        return self._agent_id
+    
+    @agent_id.setter
+    def agent_id(self, value: str) -> None:
+        self._agent_id = value
+    
+    def log_reasoning(self, message: str, *args: Any) -> None:
+        """
+        Add a step to the reasoning trace for auditability.
+        
+        Like the logging module, formatting is deferred: pass %-style args
+        instead of an f-string and the message is only built if the trace
+        is rendered.
+        
+        Example:
+            >>> self.log_reasoning("Skills match score: %.2f", skills_score)
         """
-        self.agent_id = agent_id or uuid4().hex[:12]
-        self._reasoning_log: List[str] = []
+        self._reasoning_log.append(
+            (time.perf_counter_ns() - self._run_started_ns, message, args)
+        )
     
-    def log_reasoning(self, message: str) -> None:
-        """Add a step to the reasoning trace for auditability."""
-        self._reasoning_log.append(message)
+    @staticmethod
+    def _skip_reasoning(message: str, *args: Any) -> None:
+        """Stand-in for log_reasoning when audit_enabled is False."""
+    
+    # -------------------------------------------------------------------------
+    # Run Timing
+    # -------------------------------------------------------------------------
+    
+    def _begin_run(self) -> None:
+        """
+        Mark the start of a run() invocation.
+        
+        Uses the monotonic perf counter rather than wall-clock datetimes:
+        it is cheaper to read and unaffected by system clock adjustments.
+        """
+        self._run_started_ns = time.perf_counter_ns()
+        self._run_started_at_ns = time.time_ns()
+        self._reasoning_log.clear()
+    
+    def _run_metadata(self) -> Dict[str, Any]:
+        """Diagnostics for the current run, attached to AgentResponse.metadata."""
+        return {"duration_ms": (time.perf_counter_ns() - self._run_started_ns) / 1e6}
+    
+    def _audit_trail(self) -> ReasoningTrace:
+        """
+        Hand the current run's reasoning steps to AgentResponse.audit_trail.
+        
+        Ownership of the step list moves to the returned trace and the agent
+        starts a fresh one, so no copy is made. This relies on an instance
+        executing one run() at a time.
+        """
+        trace = ReasoningTrace(self._run_started_at_ns, self._reasoning_log)
+        self._reasoning_log = []
+        return trace
+    
+    # -------------------------------------------------------------------------
+    # LLM Prompting
+    # -------------------------------------------------------------------------
+    
+    def _build_messages(self, dynamic: str) -> List[Dict[str, str]]:
+        """
+        Build chat messages with a stable system prefix.
+        
+        Args:
+            dynamic: Per-request content (the document being analyzed, etc.)
+        
+        Returns:
+            [system message with SYSTEM_PROMPT, user message with dynamic]
+        """
+        return [
+            {"role": "system", "content": self.SYSTEM_PROMPT},
+            {"role": "user", "content": dynamic},
+        ]
     
     # -------------------------------------------------------------------------
     # Configuration
@@ -448,6 +601,54 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         """
         pass
     
+    async def arun(
+        self,
+        input_data: InputT,
+        state: Optional[PipelineState] = None
+    ) -> AgentResult[OutputT]:
+        """
+        Awaitable run(), executed in a worker thread.
+        
+        Lets the orchestrator fan independent inputs out with asyncio.gather.
+        Each call runs on a shallow copy of the agent with its own reasoning
+        log, so concurrent runs never share per-run state; configuration and
+        any clients already created are shared with this instance.
+        """
+        return await asyncio.to_thread(self._worker().run, input_data, state)
+    
+    def run_batch(
+        self,
+        inputs: Sequence[InputT],
+        state: Optional[PipelineState] = None
+    ) -> List[AgentResult[OutputT]]:
+        """
+        Run several inputs, returning one result per input in order.
+        
+        The default just loops over run(). Agents that can amortize work
+        across inputs (e.g. one batched LLM call) override this.
+        """
+        return [self.run(input_data, state) for input_data in inputs]
+    
+    async def arun_batch(
+        self,
+        inputs: Sequence[InputT],
+        state: Optional[PipelineState] = None
+    ) -> List[AgentResult[OutputT]]:
+        """Awaitable run_batch(), executed in a worker thread like arun()."""
+        return await asyncio.to_thread(self._worker().run_batch, inputs, state)
+    
+    def _worker(self) -> "BaseAgent[InputT, OutputT]":
+        """
+        Shallow copy of this agent with its own reasoning log, used by
+        arun()/arun_batch() so concurrent runs never share per-run state.
+        """
+        # Resolve before copying so every worker reports the same ID
+        if self._agent_id is None:
+            self._agent_id = self.agent_id
+        worker = copy.copy(self)
+        worker._reasoning_log = []
+        return worker
+    
     # -------------------------------------------------------------------------
     # Helper Methods (for subclasses)
     # -------------------------------------------------------------------------
@@ -547,7 +748,7 @@ class BaseAgent(ABC, Generic[InputT, OutputT]):
         return AgentResult(response=response, state=state)
     
     def __repr__(self) -> str:
-        return f"<{self.__class__.__name__} name={self.name!r}>"
+        return f"<{self.agent_type} name={self.name!r}>"
 
 
 # =============================================================================
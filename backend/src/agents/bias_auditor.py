@@ -9,13 +9,23 @@ This is a CRITICAL COMPLIANCE agent that reviews all decisions.
 
 import re
 import statistics
+from collections import Counter
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from operator import attrgetter
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Sequence, Tuple
 
 from .base import BaseAgent
+from .shortlister import BORDERLINE_FLAG
 from ..schemas.candidates import FinalRanking, MatchResult
 from ..schemas.messages import PipelineState
 
+# Optional: NumPy for vectorized score statistics
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 # Comprehensive bias detection dictionaries
 GENDERED_TERMS = {
@@ -83,27 +93,105 @@ DISCRIMINATORY_PATTERNS = [
     (r"childless", "family_status", "high", "Family status discrimination"),
 ]
 
+# Fairness-score penalty per finding, by severity
+SEVERITY_LEVELS = ("critical", "high", "medium", "low")
+SEVERITY_PENALTIES = {
+    "critical": 0.4,
+    "high": 0.25,
+    "medium": 0.1,
+    "low": 0.03,
+}
+DEFAULT_SEVERITY_PENALTY = 0.1  # Unrecognised severity labels
+
 
-@dataclass
+@dataclass(slots=True)
 class BiasAuditInput:
-    """Input for bias auditing."""
+    """
+    Input for bias auditing.
+    
+    When NumPy is available, the per-ranking values the audits scan are also
+    laid out column-wise (same order as rankings) so those audits run as
+    vector operations instead of attribute lookups per ranking. Callers that
+    already walk the rankings (the orchestrator) pass the columns in; they
+    are only built here when missing. Supplied columns may be any
+    sequence; they are converted to arrays and must have one value per
+    ranking. Without NumPy the columns are always None.
+    """
     pipeline_state: PipelineState
     rankings: List[FinalRanking]
     match_results: Optional[List[MatchResult]] = None
+    scores_array: Optional[Any] = None  # np.ndarray of final_composite_score
+    explanation_lens: Optional[Any] = None  # np.ndarray of len(ranking_explanation)
+    
+    def __post_init__(self):
+        if not NUMPY_AVAILABLE:
+            # The column paths are NumPy-only; ignore anything supplied
+            self.scores_array = None
+            self.explanation_lens = None
+            return
+        count = len(self.rankings)
+        for column, dtype in (("scores_array", np.float64), ("explanation_lens", np.int64)):
+            value = getattr(self, column)
+            if value is None:
+                continue
+            value = np.asarray(value, dtype=dtype)
+            if value.shape != (count,):
+                raise ValueError(
+                    f"{column} has shape {value.shape} but there are {count} rankings"
+                )
+            setattr(self, column, value)
+        if self.scores_array is None:
+            self.scores_array = np.fromiter(
+                (r.final_composite_score for r in self.rankings),
+                dtype=np.float64,
+                count=count,
+            )
+        if self.explanation_lens is None:
+            self.explanation_lens = np.fromiter(
+                (len(r.ranking_explanation or "") for r in self.rankings),
+                dtype=np.int64,
+                count=count,
+            )
+
+
+def _gate_id(gate: Dict[str, Any]) -> str:
+    return gate.get("gate_id", "")
+
 
+_candidate_id = attrgetter("candidate_id")
 
-@dataclass
+
+@dataclass(slots=True)
 class BiasFinding:
     """A single bias finding."""
     category: str
     severity: str  # critical, high, medium, low
     description: str
-    affected_items: List[str]  # candidate IDs, gate IDs, or "all"
+    affected_items: Sequence[Any]  # candidate IDs, gate IDs, or "all"
     recommendation: str
     evidence: Optional[str] = None
+    # When set, affected_items holds source records (gates, rankings) and
+    # the IDs are only extracted from them when the finding is rendered
+    affected_key: Optional[Callable[[Any], str]] = None
+
+    def affected_ids(self) -> List[str]:
+        """IDs of the affected items, resolving affected_key if needed."""
+        if self.affected_key is None:
+            return list(self.affected_items)
+        return [self.affected_key(item) for item in self.affected_items]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "category": self.category,
+            "severity": self.severity,
+            "description": self.description,
+            "affected_items": self.affected_ids(),
+            "recommendation": self.recommendation,
+            "evidence": self.evidence,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class BiasAuditResult:
     """Results of bias audit."""
     audit_passed: bool
@@ -136,17 +224,19 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
     - Findings must be addressed before proceeding
     """
     
-    @property
-    def description(self) -> str:
-        return (
-            "Audits recruitment decisions for bias, ensuring fairness "
-            "and regulatory compliance throughout the pipeline."
-        )
+    description = (
+        "Audits recruitment decisions for bias, ensuring fairness "
+        "and regulatory compliance throughout the pipeline."
+    )
     
     @property
     def required_confidence_threshold(self) -> float:
         return 0.9  # Compliance requires high confidence
     
+    # Compliance requires the reasoning trace; never disabled
+    audit_enabled: ClassVar[bool] = True
+    audit_required: ClassVar[bool] = True
+    
     def run(
         self,
         input_data: BiasAuditInput,
@@ -168,6 +258,7 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
         if state is None:
             state = PipelineState()
         
+        self._begin_run()
         try:
             result, confidence, explanation = self._process(input_data)
             
@@ -177,6 +268,8 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
                 output=result,
                 confidence_score=confidence,
                 explanation=explanation,
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             
             return AgentResult(response=response, state=state)
@@ -188,6 +281,8 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
                 output=None,
                 confidence_score=0.0,
                 explanation=f"Bias audit failed: {str(e)}",
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             return AgentResult(response=response, state=state)
     
@@ -225,16 +320,22 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
             self.log_reasoning(f"Decision gate audit: {len(gate_findings)} issues found")
         
         # Audit 3: Score distribution analysis
-        score_findings, score_analysis = self._audit_score_distribution(input_data.rankings)
+        score_findings, score_analysis = self._audit_score_distribution(
+            input_data.rankings, input_data.scores_array
+        )
         findings.extend(score_findings)
         detailed_analysis["score_distribution"] = score_analysis
         
         # Audit 4: Ranking fairness analysis
-        ranking_findings = self._audit_ranking_fairness(input_data.rankings)
+        ranking_findings = self._audit_ranking_fairness(
+            input_data.rankings, input_data.scores_array
+        )
         findings.extend(ranking_findings)
         
         # Audit 5: Explanation quality check
-        explanation_findings = self._audit_explanation_quality(input_data.rankings)
+        explanation_findings = self._audit_explanation_quality(
+            input_data.rankings, input_data.explanation_lens
+        )
         findings.extend(explanation_findings)
         
         # Audit 6: Match result consistency (if available)
@@ -247,36 +348,29 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
         findings.extend(matching_bias)
         
         # Calculate overall fairness score
-        fairness_score = self._calculate_fairness_score(findings)
-        detailed_analysis["fairness_score_breakdown"] = self._get_score_breakdown(findings)
+        # Single pass over findings; every severity-based check below reads these counts
+        severity_counts = Counter(f.severity for f in findings)
+        fairness_score = self._calculate_fairness_score(severity_counts)
+        detailed_analysis["fairness_score_breakdown"] = self._get_score_breakdown(severity_counts)
         
         # Generate recommendations based on findings
         recommendations = self._generate_recommendations(findings)
         
         # Determine if audit passes
-        has_critical = any(f.severity == "critical" for f in findings)
-        has_high = any(f.severity == "high" for f in findings)
+        has_critical = severity_counts["critical"] > 0
+        has_high = severity_counts["high"] > 0
         audit_passed = fairness_score >= 0.7 and not has_critical
         
         # Generate compliance notes
         compliance_notes = self._generate_compliance_notes(
             input_data.pipeline_state, 
             findings, 
-            fairness_score
+            fairness_score,
+            severity_counts,
         )
         
-        # Convert findings to dict format
-        findings_dicts = [
-            {
-                "category": f.category,
-                "severity": f.severity,
-                "description": f.description,
-                "affected_items": f.affected_items,
-                "recommendation": f.recommendation,
-                "evidence": f.evidence,
-            }
-            for f in findings
-        ]
+        # Findings stay slotted objects through every audit; dicts only at the boundary
+        findings_dicts = [f.to_dict() for f in findings]
         
         result = BiasAuditResult(
             audit_passed=audit_passed,
@@ -298,10 +392,10 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
             f"Bias audit {'PASSED' if audit_passed else 'REQUIRES REVIEW'}. "
             f"Fairness score: {fairness_score:.0%}. "
             f"Found {len(findings)} issues "
-            f"(Critical: {sum(1 for f in findings if f.severity == 'critical')}, "
-            f"High: {sum(1 for f in findings if f.severity == 'high')}, "
-            f"Medium: {sum(1 for f in findings if f.severity == 'medium')}, "
-            f"Low: {sum(1 for f in findings if f.severity == 'low')}). "
+            f"(Critical: {severity_counts['critical']}, "
+            f"High: {severity_counts['high']}, "
+            f"Medium: {severity_counts['medium']}, "
+            f"Low: {severity_counts['low']}). "
             f"{len(recommendations)} recommendations provided."
         )
         
@@ -431,6 +525,11 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
         
         return context
     
+    @staticmethod
+    def _is_borderline_gate(gate: Dict[str, Any]) -> bool:
+        """Whether a decision gate was flagged as a borderline case."""
+        return BORDERLINE_FLAG in gate.get("bias_flags", ())
+    
     def _audit_decision_gates(self, state: PipelineState) -> List[BiasFinding]:
         """Audit decision gate consistency."""
         findings = []
@@ -440,17 +539,18 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
             return findings
         
         # Check for high borderline rate
-        borderline_cases = []
-        for gate in decision_gates:
-            bias_flags = gate.get("bias_flags", [])
-            if any("borderline" in str(flag).lower() for flag in bias_flags):
-                borderline_cases.append(gate.get("gate_id", "unknown"))
+        # Count first; the ID list is only needed if the finding fires
+        borderline_count = sum(1 for gate in decision_gates if self._is_borderline_gate(gate))
         
-        if len(borderline_cases) > len(decision_gates) * 0.3:
+        if borderline_count > len(decision_gates) * 0.3:
+            borderline_cases = [
+                gate.get("gate_id", "unknown")
+                for gate in decision_gates if self._is_borderline_gate(gate)
+            ]
             findings.append(BiasFinding(
                 category="threshold_calibration",
                 severity="high",
-                description=f"{len(borderline_cases)} of {len(decision_gates)} decisions ({len(borderline_cases)/len(decision_gates):.0%}) are borderline cases",
+                description=f"{borderline_count} of {len(decision_gates)} decisions ({borderline_count/len(decision_gates):.0%}) are borderline cases",
                 affected_items=borderline_cases,
                 recommendation="Review threshold settings - high borderline rate indicates poorly calibrated thresholds",
             ))
@@ -480,7 +580,8 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
                         category="threshold_strictness",
                         severity="medium",
                         description=f"Failed candidates are very close to threshold (avg margin: {avg_fail_margin:.2%})",
-                        affected_items=[g.get("gate_id", "") for g in failed_gates],
+                        affected_items=failed_gates,
+                        affected_key=_gate_id,
                         recommendation="Consider reviewing borderline rejections for potential false negatives",
                     ))
         
@@ -488,7 +589,8 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
     
     def _audit_score_distribution(
         self, 
-        rankings: List[FinalRanking]
+        rankings: List[FinalRanking],
+        scores_array: Optional[Any] = None,
     ) -> Tuple[List[BiasFinding], Dict[str, Any]]:
         """Audit score distribution for anomalies."""
         findings = []
@@ -497,17 +599,26 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
         if not rankings or len(rankings) < 3:
             return findings, {"insufficient_data": True}
         
-        scores = [r.final_composite_score for r in rankings]
-        
-        # Calculate statistics
-        mean_score = statistics.mean(scores)
-        if len(scores) >= 2:
-            stdev_score = statistics.stdev(scores)
+        if NUMPY_AVAILABLE:
+            # One vectorized pass per statistic instead of Python-level loops
+            scores = scores_array
+            if scores is None:
+                scores = np.fromiter(
+                    (r.final_composite_score for r in rankings),
+                    dtype=np.float64,
+                    count=len(rankings),
+                )
+            mean_score = float(scores.mean())
+            stdev_score = float(scores.std(ddof=1))
+            min_score = float(scores.min())
+            max_score = float(scores.max())
         else:
-            stdev_score = 0
+            scores = [r.final_composite_score for r in rankings]
+            mean_score = statistics.mean(scores)
+            stdev_score = statistics.stdev(scores)
+            min_score = min(scores)
+            max_score = max(scores)
         
-        min_score = min(scores)
-        max_score = max(scores)
         score_range = max_score - min_score
         
         analysis = {
@@ -532,14 +643,17 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
         # Check for bimodal distribution (potential group discrimination)
         if len(scores) >= 10:
             # Simple bimodality check - are there two distinct clusters?
-            sorted_scores = sorted(scores)
-            mid = len(sorted_scores) // 2
-            lower_half = sorted_scores[:mid]
-            upper_half = sorted_scores[mid:]
+            mid = len(scores) // 2
+            if NUMPY_AVAILABLE:
+                sorted_scores = np.sort(scores)
+                lower_mean = float(sorted_scores[:mid].mean())
+                upper_mean = float(sorted_scores[mid:].mean())
+            else:
+                sorted_scores = sorted(scores)
+                lower_mean = statistics.mean(sorted_scores[:mid])
+                upper_mean = statistics.mean(sorted_scores[mid:])
             
-            if lower_half and upper_half:
-                lower_mean = statistics.mean(lower_half)
-                upper_mean = statistics.mean(upper_half)
+            if mid > 0:
                 gap = upper_mean - lower_mean
                 
                 if gap > 0.3:  # Large gap between groups
@@ -555,8 +669,14 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
         
         # Check for outliers
         if stdev_score > 0:
-            outliers_low = [r.candidate_id for r in rankings if r.final_composite_score < mean_score - 2 * stdev_score]
-            outliers_high = [r.candidate_id for r in rankings if r.final_composite_score > mean_score + 2 * stdev_score]
+            low_cutoff = mean_score - 2 * stdev_score
+            high_cutoff = mean_score + 2 * stdev_score
+            if NUMPY_AVAILABLE:
+                outliers_low = [rankings[i].candidate_id for i in np.flatnonzero(scores < low_cutoff)]
+                outliers_high = [rankings[i].candidate_id for i in np.flatnonzero(scores > high_cutoff)]
+            else:
+                outliers_low = [r.candidate_id for r in rankings if r.final_composite_score < low_cutoff]
+                outliers_high = [r.candidate_id for r in rankings if r.final_composite_score > high_cutoff]
             
             if outliers_low or outliers_high:
                 analysis["outliers"] = {
@@ -566,7 +686,11 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
         
         return findings, analysis
     
-    def _audit_ranking_fairness(self, rankings: List[FinalRanking]) -> List[BiasFinding]:
+    def _audit_ranking_fairness(
+        self,
+        rankings: List[FinalRanking],
+        scores_array: Optional[Any] = None,
+    ) -> List[BiasFinding]:
         """Audit rankings for fairness issues."""
         findings = []
         
@@ -583,39 +707,62 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
                 category="review_required_pattern",
                 severity="low",
                 description="All top candidates flagged for human review",
-                affected_items=[r.candidate_id for r in top_rankings],
+                affected_items=top_rankings,
+                affected_key=_candidate_id,
                 recommendation="High review rate may indicate uncertainty in evaluations",
             ))
         
         # Check for score-rank inconsistency
-        for i, ranking in enumerate(rankings[:-1]):
+        if scores_array is not None:
+            inverted = np.flatnonzero(scores_array[:-1] < scores_array[1:])
+        else:
+            inverted = [
+                i for i in range(len(rankings) - 1)
+                if rankings[i].final_composite_score < rankings[i + 1].final_composite_score
+            ]
+        for i in inverted:
+            ranking = rankings[i]
             next_ranking = rankings[i + 1]
-            if ranking.final_composite_score < next_ranking.final_composite_score:
-                findings.append(BiasFinding(
-                    category="rank_score_inconsistency",
-                    severity="high",
-                    description=f"Rank #{ranking.rank} has lower score than rank #{next_ranking.rank}",
-                    affected_items=[ranking.candidate_id, next_ranking.candidate_id],
-                    recommendation="Rankings should be strictly ordered by score unless justified",
-                ))
+            findings.append(BiasFinding(
+                category="rank_score_inconsistency",
+                severity="high",
+                description=f"Rank #{ranking.rank} has lower score than rank #{next_ranking.rank}",
+                affected_items=[ranking.candidate_id, next_ranking.candidate_id],
+                recommendation="Rankings should be strictly ordered by score unless justified",
+            ))
         
         return findings
     
-    def _audit_explanation_quality(self, rankings: List[FinalRanking]) -> List[BiasFinding]:
+    def _audit_explanation_quality(
+        self,
+        rankings: List[FinalRanking],
+        explanation_lens: Optional[Any] = None,
+    ) -> List[BiasFinding]:
         """Audit quality of explanations for compliance."""
         findings = []
         
         if not rankings:
             return findings
         
-        poor_explanations = []
-        for r in rankings:
-            # Check if explanation exists and is meaningful
-            explanation = r.ranking_explanation or ""
-            if len(explanation) < 20:
-                poor_explanations.append(r.candidate_id)
-            elif not any(word in explanation.lower() for word in ["score", "skill", "experience", "match", "qualification"]):
-                poor_explanations.append(r.candidate_id)
+        keywords = ["score", "skill", "experience", "match", "qualification"]
+        if explanation_lens is not None:
+            # Too-short explanations come straight from the length column; only
+            # the remaining ones need their text checked for keywords
+            poor = explanation_lens < 20
+            for i in np.flatnonzero(~poor):
+                explanation = rankings[i].ranking_explanation.lower()
+                if not any(word in explanation for word in keywords):
+                    poor[i] = True
+            poor_explanations = [rankings[i].candidate_id for i in np.flatnonzero(poor)]
+        else:
+            poor_explanations = []
+            for r in rankings:
+                # Check if explanation exists and is meaningful
+                explanation = r.ranking_explanation or ""
+                if len(explanation) < 20:
+                    poor_explanations.append(r.candidate_id)
+                elif not any(word in explanation.lower() for word in keywords):
+                    poor_explanations.append(r.candidate_id)
         
         if poor_explanations:
             findings.append(BiasFinding(
@@ -717,18 +864,11 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
         
         return findings
     
-    def _calculate_fairness_score(self, findings: List[BiasFinding]) -> float:
-        """Calculate overall fairness score based on findings."""
-        severity_weights = {
-            "critical": 0.4,
-            "high": 0.25,
-            "medium": 0.1,
-            "low": 0.03,
-        }
-        
+    def _calculate_fairness_score(self, severity_counts: Counter) -> float:
+        """Calculate overall fairness score based on finding counts per severity."""
         penalty = sum(
-            severity_weights.get(f.severity, 0.1)
-            for f in findings
+            SEVERITY_PENALTIES.get(severity, DEFAULT_SEVERITY_PENALTY) * count
+            for severity, count in severity_counts.items()
         )
         
         # Cap penalty at 1.0
@@ -736,20 +876,9 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
         
         return max(0.0, 1.0 - penalty)
     
-    def _get_score_breakdown(self, findings: List[BiasFinding]) -> Dict[str, int]:
+    def _get_score_breakdown(self, severity_counts: Counter) -> Dict[str, int]:
         """Get breakdown of findings by severity."""
-        breakdown = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-        }
-        
-        for f in findings:
-            if f.severity in breakdown:
-                breakdown[f.severity] += 1
-        
-        return breakdown
+        return {severity: severity_counts[severity] for severity in SEVERITY_LEVELS}
     
     def _generate_recommendations(self, findings: List[BiasFinding]) -> List[str]:
         """Generate actionable recommendations from findings."""
@@ -786,35 +915,36 @@ class BiasAuditorAgent(BaseAgent[BiasAuditInput, BiasAuditResult]):
         self, 
         state: PipelineState, 
         findings: List[BiasFinding],
-        fairness_score: float
+        fairness_score: float,
+        severity_counts: Counter,
     ) -> List[str]:
         """Generate compliance documentation notes."""
         notes = []
         
         # Basic audit info
         notes.append(f"Audit completed at pipeline stage: {state.current_stage.value}")
-        notes.append(f"Total candidates processed: {len(state.candidates)}")
+        notes.append(f"Total candidates processed: {len(state.materialize_candidates())}")
         notes.append(f"Overall fairness score: {fairness_score:.2%}")
         
         # Finding summary
-        breakdown = self._get_score_breakdown(findings)
         notes.append(
             f"Total findings: {len(findings)} "
-            f"(Critical: {breakdown['critical']}, High: {breakdown['high']}, "
-            f"Medium: {breakdown['medium']}, Low: {breakdown['low']})"
+            f"(Critical: {severity_counts['critical']}, High: {severity_counts['high']}, "
+            f"Medium: {severity_counts['medium']}, Low: {severity_counts['low']})"
         )
         
         # Critical issues
-        critical_findings = [f for f in findings if f.severity == "critical"]
-        if critical_findings:
-            notes.append(f"CRITICAL ISSUES REQUIRING IMMEDIATE ACTION: {len(critical_findings)}")
-            for f in critical_findings:
-                notes.append(f"  - {f.description}")
+        has_critical = severity_counts["critical"] > 0
+        if has_critical:
+            notes.append(f"CRITICAL ISSUES REQUIRING IMMEDIATE ACTION: {severity_counts['critical']}")
+            for f in findings:
+                if f.severity == "critical":
+                    notes.append(f"  - {f.description}")
         
         # Compliance status
-        if fairness_score >= 0.9 and not critical_findings:
+        if fairness_score >= 0.9 and not has_critical:
             notes.append("COMPLIANCE STATUS: PASS - No significant bias concerns identified")
-        elif fairness_score >= 0.7 and not critical_findings:
+        elif fairness_score >= 0.7 and not has_critical:
             notes.append("COMPLIANCE STATUS: CONDITIONAL PASS - Minor issues to address")
         else:
             notes.append("COMPLIANCE STATUS: FAIL - Significant issues require resolution before proceeding")
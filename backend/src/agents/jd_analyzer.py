@@ -7,10 +7,14 @@ Single purpose: Extract requirements, skills, and evaluation criteria from JDs.
 This agent does NOT match candidates - only analyzes job descriptions.
 """
 
+import copy
+import hashlib
 import json
 import os
 import re
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
 
 from .base import BaseAgent
 from ..schemas.job import (
@@ -24,12 +28,24 @@ from ..schemas.job import (
 # LangChain imports for LLM integration (using Groq)
 try:
     from langchain_groq import ChatGroq
-    from langchain_core.prompts import ChatPromptTemplate
     from langchain_core.output_parsers import JsonOutputParser
     LANGCHAIN_AVAILABLE = True
 except ImportError:
     LANGCHAIN_AVAILABLE = False
 
+# Optional: embeddings for the semantic layer of the extraction cache
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
 
 # Comprehensive bias term dictionaries
 GENDERED_TERMS = {
@@ -85,6 +101,236 @@ ETHNICITY_BIASED_TERMS = {
 }
 
 
+def _build_bias_term_messages() -> Dict[str, str]:
+    """Precompute the flag text for every bias term, in reporting order."""
+    messages: Dict[str, str] = {}
+    for term, replacement in GENDERED_TERMS.items():
+        messages[term] = (
+            f"Gendered term '{term}' detected. Consider using '{replacement}' instead."
+            if replacement else f"Potentially gendered term '{term}' detected."
+        )
+    for term, replacement in AGE_BIASED_TERMS.items():
+        messages[term] = (
+            f"Age-biased term '{term}' detected. Consider using '{replacement}' instead."
+            if replacement else f"Potentially age-biased term '{term}' detected."
+        )
+    for term, replacement in DISABILITY_BIASED_TERMS.items():
+        messages[term] = f"Potential disability bias: '{term}'. Consider: '{replacement}'"
+    for term, replacement in ETHNICITY_BIASED_TERMS.items():
+        messages[term] = f"Potential ethnicity/nationality bias: '{term}'. Consider: '{replacement}'"
+    return messages
+
+
+_BIAS_TERM_MESSAGES = _build_bias_term_messages()
+_BIAS_TERM_RANK = {term: rank for rank, term in enumerate(_BIAS_TERM_MESSAGES)}
+
+
+def _compile_term_trie(terms) -> "re.Pattern[str]":
+    """
+    Compile literal terms into one regex whose alternations are factored by
+    common prefix, so the scan does a single pass over the text regardless
+    of how many terms there are. At any position the longest term matches.
+    """
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True
+    
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+    
+    return re.compile(build(trie))
+
+
+# Matched against lowercased text: re.IGNORECASE is several times slower than
+# lower() + a case-sensitive scan in CPython.
+_BIAS_TERM_PATTERN = _compile_term_trie(_BIAS_TERM_MESSAGES)
+
+# Shorter terms that are a prefix of a longer one share its start position
+# and would otherwise be shadowed by the longest match
+_BIAS_TERM_PREFIXES = {
+    term: [other for other in _BIAS_TERM_MESSAGES if other != term and term.startswith(other)]
+    for term in _BIAS_TERM_MESSAGES
+}
+
+EXCLUSIONARY_PATTERNS = [
+    (re.compile(r"must be (\d+)-(\d+) years old"),
+     "Age requirement detected - may be illegal in many jurisdictions"),
+    (re.compile(r"no older than \d+"),
+     "Age restriction detected - likely discriminatory"),
+    (re.compile(r"preferably (male|female)"),
+     "Gender preference detected - discriminatory"),
+]
+
+
+class JDExtractionCache:
+    """
+    Memoizes LLM extraction results so repeated or near-duplicate JDs
+    (the same role posted by several teams, small revisions of one JD)
+    skip the LLM round trip.
+    
+    Two layers:
+        - Exact: sha256 of everything the extraction prompt sees, plus the
+          model name. Always on; costs one hash per lookup.
+        - Semantic: cosine similarity between sentence-transformer embeddings
+          of the description, reusing the closest previous extraction when
+          it is >= similarity_threshold. Needs NumPy and
+          sentence-transformers; switched off once it has served
+          min_lookups lookups with a hit rate below min_hit_rate, since
+          embedding every JD is then pure overhead.
+    
+    Only the raw extraction is cached. Bias flags, quality score and the
+    ParsedJD itself are always rebuilt from the JD actually being analyzed.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 256,
+        similarity_threshold: float = 0.90,
+        min_hit_rate: float = 0.05,
+        min_lookups: int = 50,
+        embedding_model: str = "all-MiniLM-L6-v2",
+    ):
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.min_hit_rate = min_hit_rate
+        self.min_lookups = min_lookups
+        self.embedding_model_name = embedding_model
+        self.semantic_enabled = SEMANTIC_CACHE_AVAILABLE
+        
+        self.lookups = 0
+        self.hits = 0
+        self.semantic_lookups = 0
+        self.semantic_hits = 0
+        
+        self._lock = threading.Lock()
+        self._exact: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+        self._semantic_entries: List[Tuple[str, str, Dict[str, Any]]] = []  # (model, job_id, data)
+        self._semantic_matrix = None  # Row-normalized embeddings, one row per entry
+        self._embedding_model = None
+    
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+    
+    @staticmethod
+    def key_for(jd: JobDescription, model_name: str) -> str:
+        """Exact-match key over the extraction prompt inputs."""
+        digest = hashlib.sha256()
+        for part in (model_name, jd.title, jd.department, jd.location,
+                     jd.employment_type, jd.raw_description):
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def lookup(
+        self, jd: JobDescription, model_name: str
+    ) -> Tuple[str, Optional[Any], Optional[Tuple[str, Dict[str, Any]]]]:
+        """
+        Find a cached extraction for this JD.
+        
+        Returns:
+            (key, embedding, hit) where hit is (source_job_id, extracted_data)
+            or None. Pass key and embedding back to store() on a miss.
+        """
+        key = self.key_for(jd, model_name)
+        with self._lock:
+            self.lookups += 1
+            hit = self._exact.get(key)
+            if hit is not None:
+                self._exact.move_to_end(key)
+                self.hits += 1
+                return key, None, (hit[0], copy.deepcopy(hit[1]))
+            semantic_enabled = self.semantic_enabled
+        
+        if not semantic_enabled:
+            return key, None, None
+        
+        embedding = self._embed(jd.raw_description)
+        if embedding is None:
+            return key, None, None
+        
+        with self._lock:
+            self.semantic_lookups += 1
+            hit = self._semantic_match(embedding, model_name)
+            if hit is not None:
+                self.hits += 1
+                self.semantic_hits += 1
+                self._put_exact(key, hit)  # Identical resubmissions now hit exactly
+                hit = (hit[0], copy.deepcopy(hit[1]))
+            elif (
+                self.semantic_lookups >= self.min_lookups
+                and self.semantic_hits / self.semantic_lookups < self.min_hit_rate
+            ):
+                self.semantic_enabled = False
+        return key, embedding, hit
+    
+    def store(
+        self, key: str, embedding: Optional[Any], model_name: str, job_id: str, data: Dict[str, Any]
+    ) -> None:
+        """Record a fresh extraction under the key/embedding from lookup()."""
+        data = copy.deepcopy(data)
+        with self._lock:
+            self._put_exact(key, (job_id, data))
+            
+            if embedding is not None and self.semantic_enabled:
+                self._semantic_entries.append((model_name, job_id, data))
+                row = embedding.reshape(1, -1)
+                if self._semantic_matrix is None:
+                    self._semantic_matrix = row
+                else:
+                    self._semantic_matrix = np.vstack([self._semantic_matrix, row])
+                if len(self._semantic_entries) > self.max_entries:
+                    self._semantic_entries.pop(0)
+                    self._semantic_matrix = self._semantic_matrix[1:]
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._exact.clear()
+            self._semantic_entries.clear()
+            self._semantic_matrix = None
+    
+    def _put_exact(self, key: str, entry: Tuple[str, Dict[str, Any]]) -> None:
+        # Caller holds self._lock
+        self._exact[key] = entry
+        self._exact.move_to_end(key)
+        while len(self._exact) > self.max_entries:
+            self._exact.popitem(last=False)
+    
+    def _semantic_match(self, embedding: Any, model_name: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        if self._semantic_matrix is None:
+            return None
+        similarities = self._semantic_matrix @ embedding
+        for index in np.argsort(similarities)[::-1]:
+            if similarities[index] < self.similarity_threshold:
+                break
+            entry_model, job_id, data = self._semantic_entries[index]
+            if entry_model == model_name:
+                return job_id, data
+        return None
+    
+    def _embed(self, text: str) -> Optional[Any]:
+        with self._lock:
+            if self._embedding_model is None:
+                if not self.semantic_enabled:
+                    return None
+                try:
+                    self._embedding_model = SentenceTransformer(self.embedding_model_name)
+                except Exception:
+                    self.semantic_enabled = False
+                    return None
+            model = self._embedding_model
+        vector = model.encode(text, convert_to_numpy=True).astype(np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+
 class JDAnalyzerAgent(BaseAgent[JobDescription, ParsedJD]):
     """
     Analyzes job descriptions and extracts structured requirements using LLM.
@@ -105,9 +351,61 @@ class JDAnalyzerAgent(BaseAgent[JobDescription, ParsedJD]):
     - Generate tests
     """
     
-    def __init__(self, agent_id: Optional[str] = None, model: str = "llama-3.3-70b-versatile"):
+    SYSTEM_PROMPT = """You are an expert HR analyst and technical recruiter.
+Analyze the job description provided by the user and extract structured information.
+Return ONLY valid JSON with no additional text, using this exact structure:
+{
+    "normalized_title": "standardized job title",
+    "seniority_level": "entry|junior|mid|senior|lead|principal|executive",
+    "job_function": "engineering|data_science|product|design|marketing|sales|hr|finance|operations|other",
+    "skills": [
+        {
+            "name": "skill name",
+            "category": "technical|soft|domain",
+            "importance": "required|preferred|nice_to_have",
+            "proficiency": "beginner|intermediate|advanced|expert",
+            "years": null or number,
+            "context": "how skill is used"
+        }
+    ],
+    "experience": {
+        "minimum_years": number,
+        "preferred_years": number or null,
+        "domains": ["relevant industry/domain"],
+        "roles": ["relevant previous roles"]
+    },
+    "education": {
+        "minimum_degree": "high_school|associate|bachelors|masters|phd|none",
+        "preferred_degree": "degree or null",
+        "fields": ["accepted fields of study"],
+        "certifications_required": ["required certs"],
+        "certifications_preferred": ["preferred certs"]
+    },
+    "responsibilities": ["key responsibility 1", "key responsibility 2"],
+    "technical_topics": ["topic for technical assessment 1", "topic 2", "topic 3"],
+    "confidence": 0.0 to 1.0
+}
+
+Focus on extracting:
+1. All technical skills mentioned (programming languages, frameworks, tools)
+2. Soft skills (communication, leadership, teamwork)
+3. Domain knowledge requirements
+4. Clear technical topics that could be assessed in an MCQ test
+5. Be specific with technical topics - e.g., "Python data structures", "REST API design", "SQL query optimization"
+"""
+    
+    # Shared by all instances so hits carry across pipelines
+    extraction_cache = JDExtractionCache()
+    
+    def __init__(
+        self,
+        agent_id: Optional[str] = None,
+        model: str = "llama-3.3-70b-versatile",
+        use_cache: bool = True,
+    ):
         super().__init__(agent_id)
         self.model_name = model
+        self.use_cache = use_cache
         self._llm = None
         
     def _get_llm(self):
@@ -122,12 +420,10 @@ class JDAnalyzerAgent(BaseAgent[JobDescription, ParsedJD]):
                 )
         return self._llm
     
-    @property
-    def description(self) -> str:
-        return (
-            "Analyzes job descriptions to extract structured requirements "
-            "including skills, experience, education, and topics for assessment."
-        )
+    description = (
+        "Analyzes job descriptions to extract structured requirements "
+        "including skills, experience, education, and topics for assessment."
+    )
     
     def run(
         self,
@@ -151,6 +447,7 @@ class JDAnalyzerAgent(BaseAgent[JobDescription, ParsedJD]):
         if state is None:
             state = PipelineState(job_id=input_data.job_id)
         
+        self._begin_run()
         try:
             parsed, confidence, explanation = self._process(input_data)
             
@@ -160,6 +457,8 @@ class JDAnalyzerAgent(BaseAgent[JobDescription, ParsedJD]):
                 output=parsed,
                 confidence_score=confidence,
                 explanation=explanation,
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             
             # Update state with parsed JD
@@ -170,6 +469,7 @@ class JDAnalyzerAgent(BaseAgent[JobDescription, ParsedJD]):
                 job_description=state.job_description,
                 parsed_jd=parsed.to_dict(),
                 candidates=state.candidates,
+                candidate_profiles=state.candidate_profiles,
             )
             
             return AgentResult(response=response, state=new_state)
@@ -181,6 +481,8 @@ class JDAnalyzerAgent(BaseAgent[JobDescription, ParsedJD]):
                 output=None,
                 confidence_score=0.0,
                 explanation=f"JD analysis failed: {str(e)}",
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             return AgentResult(response=response, state=state)
     
@@ -211,8 +513,12 @@ class JDAnalyzerAgent(BaseAgent[JobDescription, ParsedJD]):
         
         if llm and LANGCHAIN_AVAILABLE:
             try:
-                extracted_data = self._extract_with_llm(input_data, llm)
-                self.log_reasoning("LLM extraction successful")
+                extracted_data, cached_from = self._extract_with_llm_cached(input_data, llm)
+                if cached_from:
+                    self.log_reasoning("Reused cached LLM extraction from JD %s", cached_from)
+                    parsing_warnings.append(f"cached from JD {cached_from}")
+                else:
+                    self.log_reasoning("LLM extraction successful")
             except Exception as e:
                 self.log_reasoning(f"LLM extraction failed: {str(e)}, falling back to rule-based")
                 extracted_data = self._extract_with_rules(input_data)
@@ -304,77 +610,41 @@ class JDAnalyzerAgent(BaseAgent[JobDescription, ParsedJD]):
         
         return parsed, confidence, explanation
     
-    def _extract_with_llm(self, jd: JobDescription, llm) -> Dict[str, Any]:
-        """Extract structured data from JD using LLM."""
+    def _extract_with_llm_cached(
+        self, jd: JobDescription, llm
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        LLM extraction through the shared extraction cache.
         
-        prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an expert HR analyst and technical recruiter. 
-Analyze the job description and extract structured information.
-Return ONLY valid JSON with no additional text."""),
-            ("user", """Analyze this job description and extract structured information:
-
-Job Title: {title}
-Department: {department}
-Location: {location}
-Employment Type: {employment_type}
-
-Job Description:
-{raw_description}
-
-Extract and return a JSON object with this exact structure:
-{{
-    "normalized_title": "standardized job title",
-    "seniority_level": "entry|junior|mid|senior|lead|principal|executive",
-    "job_function": "engineering|data_science|product|design|marketing|sales|hr|finance|operations|other",
-    "skills": [
-        {{
-            "name": "skill name",
-            "category": "technical|soft|domain",
-            "importance": "required|preferred|nice_to_have",
-            "proficiency": "beginner|intermediate|advanced|expert",
-            "years": null or number,
-            "context": "how skill is used"
-        }}
-    ],
-    "experience": {{
-        "minimum_years": number,
-        "preferred_years": number or null,
-        "domains": ["relevant industry/domain"],
-        "roles": ["relevant previous roles"]
-    }},
-    "education": {{
-        "minimum_degree": "high_school|associate|bachelors|masters|phd|none",
-        "preferred_degree": "degree or null",
-        "fields": ["accepted fields of study"],
-        "certifications_required": ["required certs"],
-        "certifications_preferred": ["preferred certs"]
-    }},
-    "responsibilities": ["key responsibility 1", "key responsibility 2"],
-    "technical_topics": ["topic for technical assessment 1", "topic 2", "topic 3"],
-    "confidence": 0.0 to 1.0
-}}
-
-Focus on extracting:
-1. All technical skills mentioned (programming languages, frameworks, tools)
-2. Soft skills (communication, leadership, teamwork)
-3. Domain knowledge requirements
-4. Clear technical topics that could be assessed in an MCQ test
-5. Be specific with technical topics - e.g., "Python data structures", "REST API design", "SQL query optimization"
-""")
-        ])
+        Returns:
+            (extracted_data, source job_id if served from cache else None)
+        """
+        if not self.use_cache:
+            return self._extract_with_llm(jd, llm), None
         
-        parser = JsonOutputParser()
-        chain = prompt | llm | parser
+        cache = self.extraction_cache
+        key, embedding, hit = cache.lookup(jd, self.model_name)
+        if hit is not None:
+            return hit[1], hit[0]
         
-        result = chain.invoke({
-            "title": jd.title,
-            "department": jd.department,
-            "location": jd.location,
-            "employment_type": jd.employment_type,
-            "raw_description": jd.raw_description,
-        })
+        extracted_data = self._extract_with_llm(jd, llm)
+        cache.store(key, embedding, self.model_name, jd.job_id, extracted_data)
+        return extracted_data, None
+    
+    def _extract_with_llm(self, jd: JobDescription, llm) -> Dict[str, Any]:
+        """Extract structured data from JD using LLM."""
+        user_content = (
+            f"Job Title: {jd.title}\n"
+            f"Department: {jd.department}\n"
+            f"Location: {jd.location}\n"
+            f"Employment Type: {jd.employment_type}\n"
+            f"\n"
+            f"Job Description:\n"
+            f"{jd.raw_description}"
+        )
         
-        return result
+        chain = llm | JsonOutputParser()
+        return chain.invoke(self._build_messages(user_content))
     
     def _extract_with_rules(self, jd: JobDescription) -> Dict[str, Any]:
         """Rule-based extraction fallback when LLM is not available."""
@@ -542,52 +812,26 @@ Focus on extracting:
         - Disability bias
         - Ethnicity/nationality bias
         """
-        flags = []
         text_lower = text.lower()
         
-        # Check for gendered language
-        for term, replacement in GENDERED_TERMS.items():
-            if term in text_lower:
-                if replacement:
-                    flags.append(
-                        f"Gendered term '{term}' detected. Consider using '{replacement}' instead."
-                    )
-                else:
-                    flags.append(f"Potentially gendered term '{term}' detected.")
-        
-        # Check for age-related bias  
-        for term, replacement in AGE_BIASED_TERMS.items():
-            if term in text_lower:
-                if replacement:
-                    flags.append(
-                        f"Age-biased term '{term}' detected. Consider using '{replacement}' instead."
-                    )
-                else:
-                    flags.append(f"Potentially age-biased term '{term}' detected.")
-        
-        # Check for disability bias
-        for term, replacement in DISABILITY_BIASED_TERMS.items():
-            if term in text_lower:
-                flags.append(
-                    f"Potential disability bias: '{term}'. Consider: '{replacement}'"
-                )
-        
-        # Check for ethnicity/nationality bias
-        for term, replacement in ETHNICITY_BIASED_TERMS.items():
-            if term in text_lower:
-                flags.append(
-                    f"Potential ethnicity/nationality bias: '{term}'. Consider: '{replacement}'"
-                )
+        # Single scan for all dictionary terms. Restarting one character past
+        # each match start keeps overlapping terms (e.g. "young" inside a
+        # longer phrase) visible, matching the old per-term substring checks.
+        found = set()
+        search = _BIAS_TERM_PATTERN.search
+        match = search(text_lower)
+        while match:
+            term = match.group()
+            found.add(term)
+            found.update(_BIAS_TERM_PREFIXES[term])
+            match = search(text_lower, match.start() + 1)
+        
+        # Report in dictionary order (gendered, age, disability, ethnicity)
+        flags = [_BIAS_TERM_MESSAGES[term] for term in sorted(found, key=_BIAS_TERM_RANK.__getitem__)]
         
         # Check for exclusionary patterns
-        exclusionary_patterns = [
-            (r"must be (\d+)-(\d+) years old", "Age requirement detected - may be illegal in many jurisdictions"),
-            (r"no older than \d+", "Age restriction detected - likely discriminatory"),
-            (r"preferably (male|female)", "Gender preference detected - discriminatory"),
-        ]
-        
-        for pattern, message in exclusionary_patterns:
-            if re.search(pattern, text_lower):
+        for pattern, message in EXCLUSIONARY_PATTERNS:
+            if pattern.search(text_lower):
                 flags.append(message)
         
         return flags
@@ -9,8 +9,9 @@ This agent does NOT make shortlisting decisions - only calculates scores.
 
 import os
 import re
+from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .base import BaseAgent
 from ..schemas.candidates import ParsedResume, MatchResult, SkillMatch
@@ -23,22 +24,77 @@ try:
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
+# Optional: NumPy for vectorized batch scoring
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Note: Groq does not provide embeddings API, so we rely on sentence-transformers
 # If sentence-transformers is unavailable, we fall back to fuzzy string matching
 GROQ_EMBEDDINGS_AVAILABLE = False  # Groq doesn't have embeddings endpoint
 
 
+@dataclass(slots=True, frozen=True)
 class MatcherInput:
     """Input structure for the Matcher agent."""
-    def __init__(
-        self, 
-        candidate_id: str = "",
-        parsed_resume: Any = None,  # Can be ParsedResume or dict
-        parsed_jd: Any = None,  # Can be ParsedJD or dict
-    ):
-        self.candidate_id = candidate_id
-        self.parsed_resume = parsed_resume
-        self.parsed_jd = parsed_jd
+    candidate_id: str = ""
+    parsed_resume: Any = None  # Can be ParsedResume or dict
+    parsed_jd: Any = None  # Can be ParsedJD or dict
+
+
+def _compile_scorer(skills_weight: float, experience_weight: float, education_weight: float
+                    ) -> Callable[[float, float, float], float]:
+    """
+    Specialize the weighted overall-score formula for one JD.
+    
+    The weights are bound once into the returned function, so scoring a
+    candidate is three multiplies and two adds with no dict or attribute
+    lookups. A closure gives the same effect as generating source with the
+    constants inlined, without exec().
+    """
+    w_s, w_e, w_ed = float(skills_weight), float(experience_weight), float(education_weight)
+    
+    def score(skills: float, experience: float, education: float) -> float:
+        return skills * w_s + experience * w_e + education * w_ed
+    
+    return score
+
+
+@dataclass(frozen=True)
+class _JDScoringContext:
+    """
+    Everything about a JD that matching needs but that does not depend on
+    the candidate. Built once per JD so batch matching doesn't repeat it.
+    """
+    skills_weight: float
+    experience_weight: float
+    education_weight: float
+    required_skills: List[SkillRequirement]
+    preferred_skills: List[SkillRequirement]
+    required_names: Tuple[str, ...]  # Lowercased skill names
+    preferred_names: Tuple[str, ...]
+    score: Callable[[float, float, float], float]  # Weighted overall score
+    
+    @classmethod
+    def from_jd(cls, jd: ParsedJD) -> "_JDScoringContext":
+        weights = jd.scoring_weights
+        skills_weight = weights.get("skills", 0.4)
+        experience_weight = weights.get("experience", 0.35)
+        education_weight = weights.get("education", 0.25)
+        required_skills = jd.get_required_skills()
+        preferred_skills = jd.get_preferred_skills()
+        return cls(
+            skills_weight=skills_weight,
+            experience_weight=experience_weight,
+            education_weight=education_weight,
+            required_skills=required_skills,
+            preferred_skills=preferred_skills,
+            required_names=tuple(r.skill_name.lower() for r in required_skills),
+            preferred_names=tuple(p.skill_name.lower() for p in preferred_skills),
+            score=_compile_scorer(skills_weight, experience_weight, education_weight),
+        )
 
 
 class MatcherAgent(BaseAgent[MatcherInput, MatchResult]):
@@ -76,12 +132,10 @@ class MatcherAgent(BaseAgent[MatcherInput, MatchResult]):
                 self.log_reasoning(f"Failed to load SentenceTransformer: {e}")
         return self._embedding_model
     
-    @property
-    def description(self) -> str:
-        return (
-            "Calculates similarity scores between resumes and job descriptions "
-            "with detailed, explainable metrics for each component."
-        )
+    description = (
+        "Calculates similarity scores between resumes and job descriptions "
+        "with detailed, explainable metrics for each component."
+    )
     
     def run(
         self,
@@ -104,6 +158,7 @@ class MatcherAgent(BaseAgent[MatcherInput, MatchResult]):
         if state is None:
             state = PipelineState()
         
+        self._begin_run()
         try:
             result, confidence, explanation = self._process(input_data)
             
@@ -113,6 +168,8 @@ class MatcherAgent(BaseAgent[MatcherInput, MatchResult]):
                 output=result,
                 confidence_score=confidence,
                 explanation=explanation,
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             
             return AgentResult(response=response, state=state)
@@ -124,6 +181,8 @@ class MatcherAgent(BaseAgent[MatcherInput, MatchResult]):
                 output=None,
                 confidence_score=0.0,
                 explanation=f"Matching failed: {str(e)}",
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             return AgentResult(response=response, state=state)
     
@@ -140,46 +199,187 @@ class MatcherAgent(BaseAgent[MatcherInput, MatchResult]):
         Returns:
             MatchResult, confidence_score, explanation
         """
-        resume = input_data.parsed_resume
         jd = input_data.parsed_jd
+        return self._match(input_data.parsed_resume, jd, _JDScoringContext.from_jd(jd))
+    
+    def run_batch(
+        self,
+        inputs: Sequence[MatcherInput],
+        state: Optional["PipelineState"] = None
+    ) -> List["AgentResult[MatchResult]"]:
+        """
+        Match several inputs, scoring those against one ParsedJD together.
+        
+        When every input shares the same parsed_jd object, they are scored
+        as in match_batch(), and each still gets its own response and audit
+        trail. Mixed JDs, or a batch that fails, fall back to one run() per
+        input, so a bad input fails alone.
+        """
+        from ..schemas.messages import PipelineState
+        from .base import AgentResult, AgentResponse, AgentStatus, ReasoningTrace
+        
+        if not inputs:
+            return []
+        jd = inputs[0].parsed_jd
+        if any(i.parsed_jd is not jd for i in inputs):
+            return super().run_batch(inputs, state)
+        if state is None:
+            state = PipelineState()
+        
+        self._begin_run()
+        try:
+            matches = self._match_many([i.parsed_resume for i in inputs], jd)
+        except Exception:
+            return super().run_batch(inputs, state)
+        
+        metadata = self._run_metadata()
+        return [
+            AgentResult(
+                response=AgentResponse(
+                    agent_name=self.name,
+                    status=AgentStatus.SUCCESS,
+                    output=result,
+                    confidence_score=confidence,
+                    explanation=explanation,
+                    metadata=dict(metadata),
+                    audit_trail=ReasoningTrace(self._run_started_at_ns, steps),
+                ),
+                state=state,
+            )
+            for result, confidence, explanation, steps in matches
+        ]
+    
+    def match_batch(self, resumes: List[ParsedResume], jd: ParsedJD) -> List[MatchResult]:
+        """
+        Match many resumes against one job description.
         
-        self.log_reasoning(f"Matching candidate {resume.candidate_id[:8]} to job {jd.job_id[:8]}")
+        JD-dependent work (scoring weights, required/preferred skill lists)
+        is resolved once for the whole batch instead of once per candidate.
+        With NumPy available, the weighted overall scores for the batch are
+        computed as one (N, 3) @ (3,) product. Unlike run(), errors
+        propagate to the caller.
+        
+        Args:
+            resumes: Parsed resumes to score
+            jd: The job description they are matched against
+        
+        Returns:
+            MatchResult per resume, in input order
+        """
+        self._begin_run()
+        return [result for result, _, _, _ in self._match_many(resumes, jd)]
+    
+    def _match_many(
+        self, resumes: List[ParsedResume], jd: ParsedJD
+    ) -> List[Tuple[MatchResult, float, str, List[Tuple[int, str, tuple]]]]:
+        """
+        Score resumes against one JD with a shared context.
+        
+        Returns:
+            (MatchResult, confidence, explanation, reasoning steps) per resume
+        """
+        context = _JDScoringContext.from_jd(jd)
+        components = []
+        steps = []
+        for resume in resumes:
+            # One reasoning log per resume, so each keeps its own trail
+            self._reasoning_log = []
+            components.append(self._score_components(resume, jd))
+            steps.append(self._reasoning_log)
+        
+        if NUMPY_AVAILABLE and components:
+            component_matrix = np.array(
+                [(c[0], c[2], c[4]) for c in components], dtype=np.float64
+            )
+            weights = np.array(
+                [context.skills_weight, context.experience_weight, context.education_weight],
+                dtype=np.float64,
+            )
+            overall_scores = (component_matrix @ weights).tolist()
+            meets_experience = np.greater_equal(component_matrix[:, 1], 0.7).tolist()
+        else:
+            overall_scores = [context.score(c[0], c[2], c[4]) for c in components]
+            meets_experience = [c[2] >= 0.7 for c in components]
+        
+        matches = []
+        for resume, comps, overall, meets, log in zip(
+            resumes, components, overall_scores, meets_experience, steps, strict=True
+        ):
+            self._reasoning_log = log
+            matches.append((*self._build_match(resume, jd, context, comps, overall, meets), log))
+        self._reasoning_log = []
+        return matches
+    
+    def _match(
+        self,
+        resume: ParsedResume,
+        jd: ParsedJD,
+        context: _JDScoringContext,
+    ) -> tuple[MatchResult, float, str]:
+        """Score a single resume using a precomputed JD context."""
+        components = self._score_components(resume, jd)
+        skills_score, _, experience_score, _, education_score = components
+        overall_score = context.score(skills_score, experience_score, education_score)
+        return self._build_match(
+            resume, jd, context, components, overall_score, experience_score >= 0.7
+        )
+    
+    def _score_components(
+        self,
+        resume: ParsedResume,
+        jd: ParsedJD,
+    ) -> Tuple[float, List[SkillMatch], float, int, float]:
+        """
+        Calculate the per-component scores for one resume.
+        
+        Returns:
+            (skills_score, skill_matches, experience_score, exp_gap, education_score)
+        """
+        self.log_reasoning("Matching candidate %s to job %s", resume.candidate_id[:8], jd.job_id[:8])
         
         # Calculate component scores with detailed breakdowns
         skills_score, skill_matches, skills_analysis = self._calculate_skills_match(resume, jd)
-        self.log_reasoning(f"Skills match score: {skills_score:.2f}")
+        self.log_reasoning("Skills match score: %.2f", skills_score)
         
         experience_score, exp_gap = self._calculate_experience_match(resume, jd)
-        self.log_reasoning(f"Experience match score: {experience_score:.2f}")
+        self.log_reasoning("Experience match score: %.2f", experience_score)
         
         education_score, edu_analysis = self._calculate_education_match(resume, jd)
-        self.log_reasoning(f"Education match score: {education_score:.2f}")
+        self.log_reasoning("Education match score: %.2f", education_score)
         
-        # Calculate weighted overall score
-        weights = jd.scoring_weights
-        overall_score = (
-            skills_score * weights.get("skills", 0.4) +
-            experience_score * weights.get("experience", 0.35) +
-            education_score * weights.get("education", 0.25)
-        )
-        self.log_reasoning(f"Overall weighted score: {overall_score:.2f}")
+        return skills_score, skill_matches, experience_score, exp_gap, education_score
+    
+    def _build_match(
+        self,
+        resume: ParsedResume,
+        jd: ParsedJD,
+        context: _JDScoringContext,
+        components: Tuple[float, List[SkillMatch], float, int, float],
+        overall_score: float,
+        meets_experience_requirement: bool,
+    ) -> tuple[MatchResult, float, str]:
+        """Assemble the MatchResult once the overall score is known."""
+        skills_score, skill_matches, experience_score, exp_gap, education_score = components
+        self.log_reasoning("Overall weighted score: %.2f", overall_score)
         
         # Count skills coverage
-        required_skills = jd.get_required_skills()
-        preferred_skills = jd.get_preferred_skills()
+        required_skills = context.required_skills
+        preferred_skills = context.preferred_skills
         
         required_met = sum(1 for m in skill_matches if m.match_score >= 0.7 
-                         and any(r.skill_name.lower() in m.required_skill.lower() 
-                                for r in required_skills))
+                         and any(name in m.required_skill.lower() 
+                                for name in context.required_names))
         preferred_met = sum(1 for m in skill_matches if m.match_score >= 0.6
-                          and any(p.skill_name.lower() in m.required_skill.lower()
-                                 for p in preferred_skills))
+                          and any(name in m.required_skill.lower()
+                                 for name in context.preferred_names))
         
         # Calculate confidence based on data quality
         confidence = self._calculate_confidence(resume, jd, skill_matches)
         
         # Identify strengths and gaps
-        strengths = self._identify_strengths(resume, jd, skill_matches, experience_score, education_score)
+        strengths = self._identify_strengths(
+            resume, skill_matches, experience_score, education_score, len(required_skills)
+        )
         gaps = self._identify_gaps(resume, jd, skill_matches, experience_score, education_score)
         
         # Build detailed match explanation
@@ -202,7 +402,7 @@ class MatcherAgent(BaseAgent[MatcherInput, MatchResult]):
             required_skills_total=len(required_skills),
             preferred_skills_met=preferred_met,
             preferred_skills_total=len(preferred_skills),
-            meets_experience_requirement=experience_score >= 0.7,
+            meets_experience_requirement=meets_experience_requirement,
             experience_gap_months=exp_gap,
             match_explanation=match_explanation,
             strengths=strengths,
@@ -597,10 +797,10 @@ class MatcherAgent(BaseAgent[MatcherInput, MatchResult]):
     def _identify_strengths(
         self, 
         resume: ParsedResume, 
-        jd: ParsedJD,
         skill_matches: List[SkillMatch],
         experience_score: float,
-        education_score: float
+        education_score: float,
+        required_skill_count: int,
     ) -> List[str]:
         """Identify candidate's strengths relative to the job."""
         strengths = []
@@ -633,7 +833,6 @@ class MatcherAgent(BaseAgent[MatcherInput, MatchResult]):
         
         # Additional skills beyond requirements
         candidate_skill_count = len(resume.skills)
-        required_skill_count = len(jd.get_required_skills())
         if candidate_skill_count > required_skill_count * 1.5:
             strengths.append("Brings additional valuable skills beyond requirements")
         
@@ -7,16 +7,22 @@ Single purpose: Manage agent execution order, state, and decision flow.
 This is the CENTRAL COORDINATOR that manages the agentic workflow.
 """
 
+import asyncio
+import time
+from collections import defaultdict, deque
 from dataclasses import dataclass
-from datetime import datetime
+from functools import cached_property
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import (
+    Any, Callable, ClassVar, Deque, Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Type,
+)
 
 from .base import BaseAgent, AgentResponse, AgentStatus
 from .jd_analyzer import JDAnalyzerAgent
 from .resume_parser import ResumeParserAgent
 from .matcher import MatcherAgent, MatcherInput
-from .shortlister import ShortlisterAgent, ShortlistInput
+from .shortlister import BORDERLINE_FLAG, ShortlisterAgent, ShortlistInput
 from .test_generator import TestGeneratorAgent, TestGeneratorInput
 from .test_evaluator import TestEvaluatorAgent, TestEvaluatorInput
 from .ranker import RankerAgent, RankerInput
@@ -29,8 +35,39 @@ from ..schemas.messages import (
     MessageType,
     DecisionGate,
 )
-from ..schemas.job import JobDescription
-from ..schemas.candidates import CandidateProfile
+from ..schemas.job import JobDescription, ParsedJD
+from ..schemas.candidates import CandidateProfile, ParsedResume
+from ..core.logger import JSONLWriter
+
+# Optional: NumPy for the bias audit's precomputed ranking columns
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+_JD_FIELDS = frozenset(JobDescription.__dataclass_fields__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _render_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Public form of a stored audit event, with its ISO-8601 timestamp."""
+    return {
+        "timestamp": (_EPOCH + timedelta(microseconds=event["timestamp_ns"] // 1000)).isoformat(),
+        "event_type": event["event_type"],
+        "pipeline_id": event["pipeline_id"],
+        "data": event["data"],
+    }
+
+
+# Stages at which the scheduler stops
+TERMINAL_STAGES = frozenset({
+    PipelineStage.COMPLETED,
+    PipelineStage.FAILED,
+    PipelineStage.AWAITING_HUMAN_REVIEW,
+})
 
 
 class OrchestratorAction(str, Enum):
@@ -42,14 +79,14 @@ class OrchestratorAction(str, Enum):
     COMPLETE = "complete"  # Pipeline finished
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrchestratorDecision:
     """Decision made by the orchestrator after each stage."""
     action: OrchestratorAction
     next_stage: Optional[PipelineStage] = None
     reason: str = ""
     requires_human_approval: bool = False
-    blocked_by: List[str] = None  # Issues blocking progress
+    blocked_by: Tuple[str, ...] = ()  # Issues blocking progress
 
 
 class OrchestratorAgent:
@@ -78,24 +115,66 @@ class OrchestratorAgent:
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
         
-        # Initialize agents
-        self.jd_analyzer = JDAnalyzerAgent()
-        self.resume_parser = ResumeParserAgent()
-        self.matcher = MatcherAgent()
-        self.shortlister = ShortlisterAgent()
-        self.test_generator = TestGeneratorAgent()
-        self.test_evaluator = TestEvaluatorAgent()
-        self.ranker = RankerAgent()
-        self.bias_auditor = BiasAuditorAgent()
-        
         # Pipeline state
         self.state: Optional[PipelineState] = None
+        self._completed_stages: Set[PipelineStage] = {PipelineStage.INITIALIZED}
+        self._job: Optional[JobDescription] = None
+        # Typed stage outputs from this run, so matching can score the
+        # objects directly instead of round-tripping through their dicts
+        self._parsed_jd: Optional[ParsedJD] = None
+        self._parsed_resumes: Dict[str, ParsedResume] = {}
         
         # Event handlers (for framework integration)
-        self._event_handlers: Dict[str, List[Callable]] = {}
+        self._event_handlers: Dict[str, List[Callable]] = defaultdict(list)
         
-        # Audit log
-        self._audit_log: List[Dict[str, Any]] = []
+        # Audit log: a bounded in-memory window, optionally persisted as JSONL
+        # by a background writer so the full history lives on disk
+        self._audit_log: Deque[Dict[str, Any]] = deque(
+            maxlen=self.config.get("audit_log_max_entries", 10_000)
+        )
+        self._audit_enabled = self.config.get("audit_log_enabled", True)
+        audit_log_path = self.config.get("audit_log_path")
+        self._audit_writer: Optional[JSONLWriter] = (
+            JSONLWriter.for_path(audit_log_path, render=_render_event)
+            if audit_log_path and self._audit_enabled
+            else None
+        )
+    
+    # -------------------------------------------------------------------------
+    # Agents (created on first use, so a run only pays for the stages it reaches)
+    # -------------------------------------------------------------------------
+    
+    @cached_property
+    def jd_analyzer(self) -> JDAnalyzerAgent:
+        return JDAnalyzerAgent()
+    
+    @cached_property
+    def resume_parser(self) -> ResumeParserAgent:
+        return ResumeParserAgent()
+    
+    @cached_property
+    def matcher(self) -> MatcherAgent:
+        return MatcherAgent()
+    
+    @cached_property
+    def shortlister(self) -> ShortlisterAgent:
+        return ShortlisterAgent()
+    
+    @cached_property
+    def test_generator(self) -> TestGeneratorAgent:
+        return TestGeneratorAgent()
+    
+    @cached_property
+    def test_evaluator(self) -> TestEvaluatorAgent:
+        return TestEvaluatorAgent()
+    
+    @cached_property
+    def ranker(self) -> RankerAgent:
+        return RankerAgent()
+    
+    @cached_property
+    def bias_auditor(self) -> BiasAuditorAgent:
+        return BiasAuditorAgent()
     
     def create_pipeline(self, job: JobDescription, candidates: List[CandidateProfile]) -> PipelineState:
         """
@@ -111,9 +190,15 @@ class OrchestratorAgent:
         self.state = PipelineState(
             job_id=job.job_id,
             current_stage=PipelineStage.INITIALIZED,
-            job_description=job.to_dict(),
-            candidates=[c.to_dict() for c in candidates],
+            # Typed inputs are kept as-is; dict forms are built only when
+            # serialized or first read (see PipelineState.materialize_candidates)
+            job_description=job,
+            candidate_profiles=list(candidates),
         )
+        self._completed_stages = {PipelineStage.INITIALIZED}
+        self._job = job
+        self._parsed_jd = None
+        self._parsed_resumes = {}
         
         self._log_event("pipeline_created", {
             "job_id": job.job_id,
@@ -126,6 +211,34 @@ class OrchestratorAgent:
         """
         Execute the complete recruitment pipeline.
         
+        Synchronous wrapper around run_pipeline_async() for callers that are
+        not already inside an event loop. From async code (including
+        Jupyter, whose loop is always running) await run_pipeline_async()
+        instead.
+        
+        Returns:
+            Final pipeline state
+        
+        Raises:
+            RuntimeError: If called while an event loop is running
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.run_pipeline_async())
+        raise RuntimeError(
+            "run_pipeline() cannot be called from a running event loop; "
+            "use 'await orchestrator.run_pipeline_async()' instead."
+        )
+    
+    async def run_pipeline_async(self) -> PipelineState:
+        """
+        Execute the complete recruitment pipeline.
+        
+        Stages are scheduled from the stage dependency graph: every stage
+        whose dependencies have completed runs in the same wavefront, so
+        independent stages (JD analysis and resume parsing) overlap.
+        
         Returns:
             Final pipeline state
         """
@@ -134,36 +247,7 @@ class OrchestratorAgent:
         
         self._log_event("pipeline_started", {"job_id": self.state.job_id})
         
-        # Pipeline execution loop
-        while self.state.current_stage not in [
-            PipelineStage.COMPLETED,
-            PipelineStage.FAILED,
-            PipelineStage.AWAITING_HUMAN_REVIEW,
-        ]:
-            try:
-                decision = self._execute_current_stage()
-                
-                if decision.action == OrchestratorAction.CONTINUE:
-                    self.state.current_stage = decision.next_stage
-                elif decision.action == OrchestratorAction.PAUSE:
-                    self.state.current_stage = PipelineStage.AWAITING_HUMAN_REVIEW
-                    break
-                elif decision.action == OrchestratorAction.ABORT:
-                    self.state.current_stage = PipelineStage.FAILED
-                    self.state.errors.append(decision.reason)
-                    break
-                elif decision.action == OrchestratorAction.COMPLETE:
-                    self.state.current_stage = PipelineStage.COMPLETED
-                    break
-                    
-            except Exception as e:
-                self._log_event("stage_error", {
-                    "stage": self.state.current_stage.value,
-                    "error": str(e),
-                })
-                self.state.errors.append(f"Error in {self.state.current_stage.value}: {str(e)}")
-                self.state.current_stage = PipelineStage.FAILED
-                break
+        await self._run_dag()
         
         self._log_event("pipeline_finished", {
             "job_id": self.state.job_id,
@@ -173,51 +257,74 @@ class OrchestratorAgent:
         
         return self.state
     
-    def _execute_current_stage(self) -> OrchestratorDecision:
-        """Execute the current pipeline stage and decide next action."""
-        stage = self.state.current_stage
-        
+    async def _run_dag(self) -> None:
+        """Run ready stages wavefront by wavefront until done, paused or failed."""
+        while self.state.current_stage not in TERMINAL_STAGES:
+            done = self._completed_stages
+            ready = [
+                stage for stage, (deps, _) in self._STAGE_DAG.items()
+                if stage not in done and deps <= done
+            ]
+            if not ready:
+                # Every node has run (the graph is acyclic, so nothing is stuck)
+                self.state.current_stage = PipelineStage.COMPLETED
+                break
+            
+            outcomes = await asyncio.gather(
+                *(self._run_stage(stage) for stage in ready),
+                return_exceptions=True,
+            )
+            
+            # PAUSE/ABORT are evaluated once the whole wavefront has finished
+            failed = paused = False
+            for stage, outcome in zip(ready, outcomes, strict=True):
+                if isinstance(outcome, Exception):
+                    self._log_event("stage_error", {
+                        "stage": stage.value,
+                        "error": str(outcome),
+                    })
+                    self.state.errors.append(f"Error in {stage.value}: {str(outcome)}")
+                    failed = True
+                elif outcome.action == OrchestratorAction.ABORT:
+                    self.state.errors.append(outcome.reason)
+                    failed = True
+                elif outcome.action == OrchestratorAction.PAUSE:
+                    paused = True
+                else:
+                    done.add(stage)
+                    self.state.current_stage = stage
+            
+            if failed:
+                self.state.current_stage = PipelineStage.FAILED
+            elif paused:
+                self.state.current_stage = PipelineStage.AWAITING_HUMAN_REVIEW
+    
+    async def _run_stage(self, stage: PipelineStage) -> OrchestratorDecision:
+        """Execute one stage node; handlers may be sync or async."""
         self._log_event("stage_started", {"stage": stage.value})
         
-        if stage == PipelineStage.INITIALIZED:
-            return self._run_jd_analysis()
-        elif stage == PipelineStage.JD_ANALYSIS:
-            return self._run_resume_parsing()
-        elif stage == PipelineStage.RESUME_PARSING:
-            return self._run_matching()
-        elif stage == PipelineStage.MATCHING:
-            return self._run_shortlisting()
-        elif stage == PipelineStage.SHORTLISTING:
-            return self._run_test_generation()
-        elif stage == PipelineStage.TEST_GENERATION:
-            # In real implementation, would wait for test completion
-            return self._run_test_evaluation()
-        elif stage == PipelineStage.TEST_EVALUATION:
-            return self._run_ranking()
-        elif stage == PipelineStage.RANKING:
-            return self._run_bias_audit()
-        elif stage == PipelineStage.BIAS_AUDIT:
-            return OrchestratorDecision(
-                action=OrchestratorAction.COMPLETE,
-                reason="Pipeline completed successfully",
-            )
-        else:
-            return OrchestratorDecision(
-                action=OrchestratorAction.ABORT,
-                reason=f"Unknown stage: {stage}",
-            )
+        _, handler = self._STAGE_DAG[stage]
+        decision = handler(self)
+        if asyncio.iscoroutine(decision):
+            decision = await decision
+        return decision
     
-    def _run_jd_analysis(self) -> OrchestratorDecision:
+    async def _run_jd_analysis(self) -> OrchestratorDecision:
         """Run JD analysis stage."""
-        job_dict = self.state.job_description
-        job = JobDescription(**{k: v for k, v in job_dict.items() 
-                               if k in JobDescription.__dataclass_fields__})
-        
-        result = self.jd_analyzer.run(job)
+        # Use the object passed to create_pipeline; only rebuild from the
+        # serialized dict when the state was populated some other way
+        job = self._job
+        if job is None:
+            job = self.state.job_description
+            if not isinstance(job, JobDescription):
+                job = JobDescription(**{k: job[k] for k in _JD_FIELDS & job.keys()})
+        
+        result = await self.jd_analyzer.arun(job)
         response = result.response
         self._record_agent_response(response)
         
         if response.status == AgentStatus.SUCCESS:
+            self._parsed_jd = response.output
             self.state.parsed_jd = response.output.to_dict() if response.output else {}
             return OrchestratorDecision(
                 action=OrchestratorAction.CONTINUE,
@@ -230,12 +337,23 @@ class OrchestratorAgent:
                 reason=f"JD analysis failed: {response.explanation}",
             )
     
-    def _run_resume_parsing(self) -> OrchestratorDecision:
-        """Run resume parsing for all candidates."""
+    async def _run_resume_parsing(self) -> OrchestratorDecision:
+        """Run resume parsing for all candidates concurrently."""
         parsed_resumes = []
         errors = []
+        inputs = []
         
-        for candidate_dict in self.state.candidates:
+        # Resumes are parsed in batches (one batched LLM call each); bound the
+        # number of batches in flight so roughly parse_concurrency resumes are
+        # being parsed at once and large jobs don't trip provider rate limits
+        batch_size = max(1, self.config.get("parse_batch_size", 32))
+        limit = asyncio.Semaphore(max(1, self.config.get("parse_concurrency", 32) // batch_size))
+        
+        async def parse(batch: List[Dict[str, Any]]):
+            async with limit:
+                return await self.resume_parser.arun_batch(batch)
+        
+        for candidate_dict in self.state.materialize_candidates():
             input_data = {
                 "candidate_id": candidate_dict.get("candidate_id", ""),
                 "resume_text": candidate_dict.get("resume_text", ""),
@@ -250,11 +368,29 @@ class OrchestratorAgent:
                 })
                 continue
             
-            result = self.resume_parser.run(input_data)
+            inputs.append(input_data)
+        
+        batches = [inputs[i:i + batch_size] for i in range(0, len(inputs), batch_size)]
+        batch_results = await asyncio.gather(
+            *(parse(batch) for batch in batches),
+            return_exceptions=True,
+        )
+        
+        # Record in candidate order; gather and run_batch preserve input order
+        results: List[Any] = []
+        for batch, outcome in zip(batches, batch_results, strict=True):
+            results.extend([outcome] * len(batch) if isinstance(outcome, BaseException) else outcome)
+        
+        for input_data, result in zip(inputs, results, strict=True):
+            if isinstance(result, BaseException):
+                errors.append(f"Failed to parse resume for {input_data['candidate_id'][:8]}")
+                continue
+            
             response = result.response
             self._record_agent_response(response)
             
             if response.status == AgentStatus.SUCCESS and response.output:
+                self._parsed_resumes[input_data["candidate_id"]] = response.output
                 parsed_resumes.append({
                     "candidate_id": input_data["candidate_id"],
                     "parsed": response.output.to_dict(),
@@ -262,12 +398,12 @@ class OrchestratorAgent:
             else:
                 errors.append(f"Failed to parse resume for {input_data['candidate_id'][:8]}")
         
-        # Store parsed resumes in state (update candidate entries)
+        # Store parsed resumes in state. Candidate dicts are owned by this
+        # pipeline's state (built in create_pipeline), so update them in place
+        # rather than copying every record.
         parsed_map = {pr["candidate_id"]: pr["parsed"] for pr in parsed_resumes}
-        self.state.candidates = [
-            {**c, "parsed_resume": parsed_map.get(c.get("candidate_id", ""), {})}
-            for c in self.state.candidates
-        ]
+        for c in self.state.candidates:
+            c["parsed_resume"] = parsed_map.get(c.get("candidate_id", ""), {})
         
         if errors:
             self.state.warnings.extend(errors)
@@ -280,24 +416,27 @@ class OrchestratorAgent:
     
     def _run_matching(self) -> OrchestratorDecision:
         """Run resume-JD matching for all parsed candidates."""
-        from ..schemas.candidates import MatchResult
-        
         match_results = []
-        parsed_jd = self.state.parsed_jd or {}
+        # Prefer this run's typed outputs; the state dicts are the fallback
+        parsed_jd = self._parsed_jd or self.state.parsed_jd or {}
         
+        matcher_inputs = []
         for candidate_dict in self.state.candidates:
-            parsed_resume = candidate_dict.get("parsed_resume", {})
+            candidate_id = candidate_dict.get("candidate_id", "")
+            parsed_resume = (
+                self._parsed_resumes.get(candidate_id) or candidate_dict.get("parsed_resume", {})
+            )
             if not parsed_resume:
                 continue
             
-            # Prepare matcher input
-            matcher_input = MatcherInput(
-                candidate_id=candidate_dict.get("candidate_id", ""),
+            matcher_inputs.append(MatcherInput(
+                candidate_id=candidate_id,
                 parsed_resume=parsed_resume,
                 parsed_jd=parsed_jd,
-            )
-            
-            result = self.matcher.run(matcher_input)
+            ))
+        
+        # One batch against the shared JD; still one response per candidate
+        for result in self.matcher.run_batch(matcher_inputs):
             response = result.response
             self._record_agent_response(response)
             
@@ -344,12 +483,13 @@ class OrchestratorAgent:
                 self.state.add_decision_gate(decision)
             
             # Check if too many borderline cases
-            borderline = [d for d in response.output.decisions 
-                         if any("borderline" in str(f).lower() for f in d.bias_flags)]
-            if len(borderline) > len(match_results) * 0.25:
+            borderline_count = sum(
+                1 for d in response.output.decisions if BORDERLINE_FLAG in d.bias_flags
+            )
+            if borderline_count > len(match_results) * 0.25:
                 return OrchestratorDecision(
                     action=OrchestratorAction.PAUSE,
-                    reason=f"High borderline rate ({len(borderline)}/{len(match_results)}) - human review recommended",
+                    reason=f"High borderline rate ({borderline_count}/{len(match_results)}) - human review recommended",
                     requires_human_approval=True,
                 )
         
@@ -539,11 +679,17 @@ class OrchestratorAgent:
         """Run final bias audit."""
         from ..schemas.candidates import FinalRanking, MatchResult
         
-        # Reconstruct ranking objects
-        rankings = [
-            FinalRanking(**{k: v for k, v in r.items() if k in FinalRanking.__dataclass_fields__})
-            for r in self.state.final_rankings
-        ]
+        # Reconstruct ranking objects, collecting the audit's score and
+        # explanation-length columns in the same pass
+        rankings = []
+        scores = []
+        explanation_lens = []
+        for r in self.state.final_rankings:
+            rankings.append(
+                FinalRanking(**{k: v for k, v in r.items() if k in FinalRanking.__dataclass_fields__})
+            )
+            scores.append(r.get("final_composite_score", 0.0))
+            explanation_lens.append(len(r.get("ranking_explanation") or ""))
         
         # Reconstruct match results for deeper analysis
         match_results = [
@@ -556,6 +702,8 @@ class OrchestratorAgent:
             pipeline_state=self.state,
             rankings=rankings,
             match_results=match_results,
+            scores_array=np.asarray(scores, dtype=np.float64) if NUMPY_AVAILABLE else None,
+            explanation_lens=np.asarray(explanation_lens, dtype=np.int64) if NUMPY_AVAILABLE else None,
         )
         
         result = self.bias_auditor.run(audit_input)
@@ -619,28 +767,57 @@ class OrchestratorAgent:
         })
     
     def _log_event(self, event_type: str, data: Dict[str, Any]) -> None:
-        """Log an orchestrator event for auditing."""
+        """
+        Log an orchestrator event for auditing.
+        
+        Events store a time_ns() integer; ISO formatting is deferred to
+        get_audit_log(), handler dispatch and the background writer.
+        """
+        # .get() rather than [] so dispatch never adds empty handler lists
+        handlers = self._event_handlers.get(event_type)
+        if not self._audit_enabled and not handlers:
+            return
+        
         event = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp_ns": time.time_ns(),
             "event_type": event_type,
             "pipeline_id": self.state.pipeline_id if self.state else None,
             "data": data,
         }
-        self._audit_log.append(event)
+        if self._audit_enabled:
+            self._audit_log.append(event)
+            if self._audit_writer is not None:
+                self._audit_writer.append(event)
         
         # Emit to registered handlers
-        for handler in self._event_handlers.get(event_type, []):
-            handler(event)
+        if handlers:
+            rendered = _render_event(event)
+            # Snapshot: a handler may register further handlers while we iterate
+            for handler in tuple(handlers):
+                handler(rendered)
     
     def on_event(self, event_type: str, handler: Callable) -> None:
         """Register an event handler for framework integration."""
-        if event_type not in self._event_handlers:
-            self._event_handlers[event_type] = []
         self._event_handlers[event_type].append(handler)
     
-    def get_audit_log(self) -> List[Dict[str, Any]]:
-        """Get the complete audit log."""
-        return self._audit_log.copy()
+    def get_audit_log(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        Get an immutable snapshot of the audit log.
+        
+        Holds the most recent audit_log_max_entries events; when
+        audit_log_path is configured the complete log is on disk.
+        """
+        return tuple(self.iter_audit_log())
+    
+    def iter_audit_log(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate the audit log without building a snapshot.
+        
+        Events are rendered as they are yielded. Consume it before the
+        pipeline logs again: the underlying deque may not change while
+        it is being iterated.
+        """
+        return map(_render_event, self._audit_log)
     
     def get_pipeline_summary(self) -> Dict[str, Any]:
         """Get a summary of the current pipeline state."""
@@ -651,7 +828,7 @@ class OrchestratorAgent:
             "pipeline_id": self.state.pipeline_id,
             "job_id": self.state.job_id,
             "current_stage": self.state.current_stage.value,
-            "candidate_count": len(self.state.candidates),
+            "candidate_count": len(self.state.materialize_candidates()),
             "shortlisted_count": len(self.state.shortlisted_candidates),
             "final_rankings_count": len(self.state.final_rankings),
             "error_count": len(self.state.errors),
@@ -664,3 +841,26 @@ class OrchestratorAgent:
                 for r in self.state.agent_responses
             ),
         }
+    
+    # Stage dependency graph: stage -> (stages it waits on, handler).
+    # A stage is named after the PipelineStage it completes. Defined after the
+    # handlers so it can hold them as plain functions; _run_stage binds self.
+    _STAGE_DAG: ClassVar[Dict[PipelineStage, Tuple[FrozenSet[PipelineStage], Callable[..., Any]]]] = {
+        PipelineStage.JD_ANALYSIS: (
+            frozenset({PipelineStage.INITIALIZED}), _run_jd_analysis),
+        PipelineStage.RESUME_PARSING: (
+            frozenset({PipelineStage.INITIALIZED}), _run_resume_parsing),
+        PipelineStage.MATCHING: (
+            frozenset({PipelineStage.JD_ANALYSIS, PipelineStage.RESUME_PARSING}), _run_matching),
+        PipelineStage.SHORTLISTING: (
+            frozenset({PipelineStage.MATCHING}), _run_shortlisting),
+        PipelineStage.TEST_GENERATION: (
+            frozenset({PipelineStage.SHORTLISTING}), _run_test_generation),
+        # In real implementation, would wait for test completion
+        PipelineStage.TEST_EVALUATION: (
+            frozenset({PipelineStage.TEST_GENERATION}), _run_test_evaluation),
+        PipelineStage.RANKING: (
+            frozenset({PipelineStage.TEST_EVALUATION}), _run_ranking),
+        PipelineStage.BIAS_AUDIT: (
+            frozenset({PipelineStage.RANKING}), _run_bias_audit),
+    }
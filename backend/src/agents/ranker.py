@@ -13,6 +13,13 @@ from typing import Any, Dict, List, Optional
 from .base import BaseAgent
 from ..schemas.candidates import MatchResult, TestResult, FinalRanking
 
+# Optional: NumPy for vectorized composite scores
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 @dataclass
 class RankerInput:
@@ -56,12 +63,10 @@ class RankerAgent(BaseAgent[RankerInput, RankerOutput]):
     - Rankings must be explainable and auditable
     """
     
-    @property
-    def description(self) -> str:
-        return (
-            "Ranks candidates by combining match and test scores with "
-            "configurable weights, producing explainable recommendations."
-        )
+    description = (
+        "Ranks candidates by combining match and test scores with "
+        "configurable weights, producing explainable recommendations."
+    )
     
     @property
     def required_confidence_threshold(self) -> float:
@@ -88,6 +93,7 @@ class RankerAgent(BaseAgent[RankerInput, RankerOutput]):
         if state is None:
             state = PipelineState()
         
+        self._begin_run()
         try:
             result, confidence, explanation = self._process(input_data)
             
@@ -97,6 +103,8 @@ class RankerAgent(BaseAgent[RankerInput, RankerOutput]):
                 output=result,
                 confidence_score=confidence,
                 explanation=explanation,
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             
             return AgentResult(response=response, state=state)
@@ -108,6 +116,8 @@ class RankerAgent(BaseAgent[RankerInput, RankerOutput]):
                 output=None,
                 confidence_score=0.0,
                 explanation=f"Ranking failed: {str(e)}",
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             return AgentResult(response=response, state=state)
     
@@ -131,33 +141,41 @@ class RankerAgent(BaseAgent[RankerInput, RankerOutput]):
         match_map = {m.candidate_id: m for m in input_data.match_results}
         test_map = {t.candidate_id: t for t in input_data.test_results}
         
-        # Calculate composite scores
-        scores = []
-        for candidate_id in match_map.keys():
-            match_result = match_map.get(candidate_id)
-            test_result = test_map.get(candidate_id)
-            
-            if not match_result:
-                continue
-            
-            resume_score = match_result.overall_match_score
-            test_score = test_result.total_score if test_result else 0.0
-            
-            # Calculate weighted composite
-            weights = input_data.weights
-            composite = (
-                resume_score * weights.get("resume", 0.5) +
-                test_score * weights.get("test", 0.5)
-            )
-            
-            scores.append({
+        # Score components, one column per candidate
+        candidates = [
+            (candidate_id, match_result, test_map.get(candidate_id))
+            for candidate_id, match_result in match_map.items()
+        ]
+        resume_scores = [m.overall_match_score for _, m, _ in candidates]
+        test_scores = [t.total_score if t else 0.0 for _, _, t in candidates]
+        
+        # Calculate weighted composites for the whole batch at once
+        weights = input_data.weights
+        resume_weight = weights.get("resume", 0.5)
+        test_weight = weights.get("test", 0.5)
+        if NUMPY_AVAILABLE:
+            composites = (
+                np.asarray(resume_scores, dtype=np.float64) * resume_weight
+                + np.asarray(test_scores, dtype=np.float64) * test_weight
+            ).tolist()
+        else:
+            composites = [
+                r * resume_weight + t * test_weight
+                for r, t in zip(resume_scores, test_scores, strict=True)
+            ]
+        
+        scores = [
+            {
                 "candidate_id": candidate_id,
                 "resume_score": resume_score,
                 "test_score": test_score,
                 "composite": composite,
                 "match_result": match_result,
                 "test_result": test_result,
-            })
+            }
+            for (candidate_id, match_result, test_result), resume_score, test_score, composite
+            in zip(candidates, resume_scores, test_scores, composites, strict=True)
+        ]
         
         # Sort by composite score
         scores.sort(key=lambda x: x["composite"], reverse=True)
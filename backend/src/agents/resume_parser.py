@@ -7,11 +7,15 @@ Single purpose: Parse resumes into a standardized format.
 This agent does NOT score or evaluate - only extracts and structures.
 """
 
+import copy
+import hashlib
 import json
 import os
 import re
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 from .base import BaseAgent
 from ..schemas.candidates import (
@@ -76,21 +80,45 @@ class ResumeParserAgent(BaseAgent[Dict[str, Any], ParsedResume]):
     - Compare to job descriptions
     """
     
-    @property
-    def description(self) -> str:
-        return (
-            "Parses raw resumes into structured data. Extracts skills, "
-            "experience, and education while anonymizing personal information."
-        )
+    description = (
+        "Parses raw resumes into structured data. Extracts skills, "
+        "experience, and education while anonymizing personal information."
+    )
     
     @property
     def required_confidence_threshold(self) -> float:
         return 0.6  # Lower threshold as parsing can handle some ambiguity
     
+    # Identical resume bodies (re-submitted applications, template resumes)
+    # are parsed once; this many distinct texts are remembered per agent
+    parse_cache_size: int = 512
+    
     def __init__(self, agent_id: Optional[str] = None, model: str = "llama-3.3-70b-versatile"):
         super().__init__(agent_id)
         self.model_name = model
         self._llm = None
+        # blake2b(resume_text) -> (parsed, confidence, explanation details).
+        # Shared by the worker copies arun()/arun_batch() make, hence the lock.
+        self._parse_cache: "OrderedDict[bytes, Tuple[ParsedResume, float, str]]" = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _resume_key(resume_text: str) -> bytes:
+        return hashlib.blake2b(resume_text.encode("utf-8"), digest_size=16).digest()
+    
+    def _cached_parse(self, key: bytes) -> Optional[Tuple[ParsedResume, float, str]]:
+        with self._parse_cache_lock:
+            hit = self._parse_cache.get(key)
+            if hit is not None:
+                self._parse_cache.move_to_end(key)
+            return hit
+    
+    def _store_parse(self, key: bytes, entry: Tuple[ParsedResume, float, str]) -> None:
+        with self._parse_cache_lock:
+            self._parse_cache[key] = entry
+            self._parse_cache.move_to_end(key)
+            while len(self._parse_cache) > self.parse_cache_size:
+                self._parse_cache.popitem(last=False)
     
     def _get_llm(self):
         """Lazy initialization of Groq LLM client."""
@@ -104,6 +132,10 @@ class ResumeParserAgent(BaseAgent[Dict[str, Any], ParsedResume]):
                 )
         return self._llm
     
+    def _worker(self) -> "ResumeParserAgent":
+        self._get_llm()  # Create the client once so concurrent workers share it
+        return super()._worker()
+    
     def run(
         self,
         input_data: Dict[str, Any],
@@ -119,6 +151,59 @@ class ResumeParserAgent(BaseAgent[Dict[str, Any], ParsedResume]):
         Returns:
             AgentResult with ParsedResume and updated state
         """
+        return self._run_one(input_data, state)
+    
+    def run_batch(
+        self,
+        inputs: Sequence[Dict[str, Any]],
+        state: Optional["PipelineState"] = None
+    ) -> List["AgentResult[ParsedResume]"]:
+        """
+        Parse several resumes, sharing one batched LLM call.
+        
+        All LLM extractions are issued together through the chain's
+        batch() (concurrent requests on one client); the results are then
+        assembled per resume, each with its own response and audit trail.
+        Failed extractions fall back to rule-based parsing individually.
+        """
+        llm_results: List[Optional[Union[Dict[str, Any], Exception]]] = [None] * len(inputs)
+        llm = self._get_llm()
+        if llm and LANGCHAIN_AVAILABLE:
+            # Only send texts that aren't empty (they fail validation), already
+            # cached, or repeated earlier in this batch; repeats are served from
+            # the cache once the first copy has been assembled
+            indices = []
+            seen = set()
+            for i, d in enumerate(inputs):
+                text = d.get("resume_text")
+                if not text:
+                    continue
+                key = self._resume_key(text)
+                if key in seen or self._cached_parse(key) is not None:
+                    continue
+                seen.add(key)
+                indices.append(i)
+            if indices:
+                extracted = self._extraction_chain(llm).batch(
+                    [{"resume_text": inputs[i]["resume_text"][:8000]} for i in indices],
+                    config={"max_concurrency": len(indices)},
+                    return_exceptions=True,
+                )
+                for i, result in zip(indices, extracted, strict=True):
+                    llm_results[i] = result
+        
+        return [
+            self._run_one(input_data, state, llm_result)
+            for input_data, llm_result in zip(inputs, llm_results, strict=True)
+        ]
+    
+    def _run_one(
+        self,
+        input_data: Dict[str, Any],
+        state: Optional["PipelineState"],
+        llm_result: Optional[Union[Dict[str, Any], Exception]] = None,
+    ) -> "AgentResult[ParsedResume]":
+        """Build the AgentResult for one resume (optionally pre-extracted)."""
         from ..schemas.messages import PipelineState
         from .base import AgentResult, AgentResponse, AgentStatus
         
@@ -126,8 +211,9 @@ class ResumeParserAgent(BaseAgent[Dict[str, Any], ParsedResume]):
         if state is None:
             state = PipelineState()
         
+        self._begin_run()
         try:
-            parsed, confidence, explanation = self._process(input_data)
+            parsed, confidence, explanation = self._process(input_data, llm_result)
             
             response = AgentResponse(
                 agent_name=self.name,
@@ -135,6 +221,8 @@ class ResumeParserAgent(BaseAgent[Dict[str, Any], ParsedResume]):
                 output=parsed,
                 confidence_score=confidence,
                 explanation=explanation,
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             
             return AgentResult(response=response, state=state)
@@ -146,12 +234,15 @@ class ResumeParserAgent(BaseAgent[Dict[str, Any], ParsedResume]):
                 output=None,
                 confidence_score=0.0,
                 explanation=f"Resume parsing failed: {str(e)}",
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             return AgentResult(response=response, state=state)
 
     def _process(
         self, 
-        input_data: Dict[str, Any]
+        input_data: Dict[str, Any],
+        llm_result: Optional[Union[Dict[str, Any], Exception]] = None,
     ) -> tuple[ParsedResume, float, str]:
         """
         Parse a resume into structured format using LLM.
@@ -162,6 +253,8 @@ class ResumeParserAgent(BaseAgent[Dict[str, Any], ParsedResume]):
                 "resume_text": str,  # Raw text content
                 "resume_format": str  # pdf, docx, txt
             }
+            llm_result: LLM extraction already made by run_batch (or the
+                exception it raised); None to extract here
         
         Returns:
             ParsedResume, confidence_score, explanation
@@ -177,18 +270,34 @@ class ResumeParserAgent(BaseAgent[Dict[str, Any], ParsedResume]):
         self.log_reasoning(f"Processing resume for candidate {candidate_id[:8]}...")
         self.log_reasoning(f"Resume length: {len(resume_text)} characters")
         
+        cache_key = self._resume_key(resume_text)
+        cached = self._cached_parse(cache_key)
+        if cached is not None:
+            cached_parsed, confidence, details = cached
+            parsed = copy.deepcopy(cached_parsed)
+            parsed.candidate_id = candidate_id
+            parsed.parsing_timestamp = datetime.now(timezone.utc)
+            self.log_reasoning("Identical resume already parsed; reusing that result")
+            return parsed, confidence, f"Parsed resume for candidate {candidate_id[:8]}. {details}"
+        
         # Try LLM extraction first, fallback to rule-based
         llm = self._get_llm()
         parsing_warnings = []
+        cacheable = True  # Don't pin a degraded fallback parse in the cache
         
         if llm and LANGCHAIN_AVAILABLE:
             try:
-                extracted_data = self._extract_with_llm(resume_text, llm)
+                if llm_result is None:
+                    llm_result = self._extract_with_llm(resume_text, llm)
+                elif isinstance(llm_result, Exception):
+                    raise llm_result
+                extracted_data = llm_result
                 self.log_reasoning("LLM extraction successful")
             except Exception as e:
                 self.log_reasoning(f"LLM extraction failed: {str(e)}, falling back to rule-based")
                 extracted_data = self._extract_with_rules(resume_text)
                 parsing_warnings.append(f"LLM extraction failed, used rule-based fallback: {str(e)}")
+                cacheable = False
         else:
             self.log_reasoning("LLM not available, using rule-based extraction")
             extracted_data = self._extract_with_rules(resume_text)
@@ -255,20 +364,28 @@ class ResumeParserAgent(BaseAgent[Dict[str, Any], ParsedResume]):
         )
         
         confidence = extracted_data.get("confidence", 0.7)
-        explanation = (
-            f"Parsed resume for candidate {candidate_id[:8]}. "
+        details = (
             f"Extracted {len(skills)} skills, {len(experience)} experience entries, "
             f"and {len(education)} education entries. "
             f"Total experience: {total_months // 12} years {total_months % 12} months. "
             f"Quality score: {quality_score:.2f}."
         )
+        explanation = f"Parsed resume for candidate {candidate_id[:8]}. {details}"
         
         self.log_reasoning(f"Resume parsing completed: {explanation}")
         
+        if cacheable:
+            self._store_parse(cache_key, (copy.deepcopy(parsed), confidence, details))
+        
         return parsed, confidence, explanation
     
     def _extract_with_llm(self, resume_text: str, llm) -> Dict[str, Any]:
         """Extract structured data from resume using LLM."""
+        chain = self._extraction_chain(llm)
+        return chain.invoke({"resume_text": resume_text[:8000]})  # Limit to 8k chars
+    
+    def _extraction_chain(self, llm):
+        """Prompt | LLM | JSON parser chain used for single and batched extraction."""
         prompt = ChatPromptTemplate.from_messages([
             ("system", """You are an expert resume parser. Extract structured information from the resume.
             
@@ -299,10 +416,7 @@ Return a JSON object with this exact structure:
         ])
         
         parser = JsonOutputParser()
-        chain = prompt | llm | parser
-        
-        result = chain.invoke({"resume_text": resume_text[:8000]})  # Limit to 8k chars
-        return result
+        return prompt | llm | parser
     
     def _extract_with_rules(self, resume_text: str) -> Dict[str, Any]:
         """Fallback rule-based extraction when LLM is unavailable."""
@@ -15,6 +15,11 @@ from ..schemas.candidates import MatchResult
 from ..schemas.messages import DecisionGate
 
 
+# Bias flag attached to gates whose score falls within the borderline margin.
+# Downstream checks test list membership against this exact value.
+BORDERLINE_FLAG = "borderline_case_requires_review"
+
+
 @dataclass
 class ShortlistInput:
     """Input for the shortlister agent."""
@@ -50,12 +55,10 @@ class ShortlisterAgent(BaseAgent[ShortlistInput, ShortlistOutput]):
     - Make final hiring decisions
     """
     
-    @property
-    def description(self) -> str:
-        return (
-            "Filters candidates based on match scores, applying threshold-based "
-            "decisions with full transparency and bias monitoring."
-        )
+    description = (
+        "Filters candidates based on match scores, applying threshold-based "
+        "decisions with full transparency and bias monitoring."
+    )
     
     @property
     def required_confidence_threshold(self) -> float:
@@ -82,6 +85,7 @@ class ShortlisterAgent(BaseAgent[ShortlistInput, ShortlistOutput]):
         if state is None:
             state = PipelineState()
         
+        self._begin_run()
         try:
             result, confidence, explanation = self._process(input_data)
             
@@ -91,6 +95,8 @@ class ShortlisterAgent(BaseAgent[ShortlistInput, ShortlistOutput]):
                 output=result,
                 confidence_score=confidence,
                 explanation=explanation,
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             
             return AgentResult(response=response, state=state)
@@ -102,6 +108,8 @@ class ShortlisterAgent(BaseAgent[ShortlistInput, ShortlistOutput]):
                 output=None,
                 confidence_score=0.0,
                 explanation=f"Shortlisting failed: {str(e)}",
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             return AgentResult(response=response, state=state)
     
@@ -145,7 +153,7 @@ class ShortlisterAgent(BaseAgent[ShortlistInput, ShortlistOutput]):
             is_borderline = abs(score - threshold) < 0.1
             if is_borderline:
                 borderline_count += 1
-                gate.bias_flags.append("borderline_case_requires_review")
+                gate.bias_flags.append(BORDERLINE_FLAG)
             
             # Add bias flags from match result
             gate.bias_flags.extend(match.bias_flags)
@@ -44,12 +44,10 @@ class TestEvaluatorAgent(BaseAgent[TestEvaluatorInput, TestResult]):
     - Make hiring decisions
     """
     
-    @property
-    def description(self) -> str:
-        return (
-            "Evaluates candidate test responses, calculating scores with "
-            "full transparency and integrity monitoring."
-        )
+    description = (
+        "Evaluates candidate test responses, calculating scores with "
+        "full transparency and integrity monitoring."
+    )
     
     def run(
         self,
@@ -72,6 +70,7 @@ class TestEvaluatorAgent(BaseAgent[TestEvaluatorInput, TestResult]):
         if state is None:
             state = PipelineState()
         
+        self._begin_run()
         try:
             result, confidence, explanation = self._process(input_data)
             
@@ -81,6 +80,8 @@ class TestEvaluatorAgent(BaseAgent[TestEvaluatorInput, TestResult]):
                 output=result,
                 confidence_score=confidence,
                 explanation=explanation,
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             
             return AgentResult(response=response, state=state)
@@ -92,6 +93,8 @@ class TestEvaluatorAgent(BaseAgent[TestEvaluatorInput, TestResult]):
                 output=None,
                 confidence_score=0.0,
                 explanation=f"Test evaluation failed: {str(e)}",
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             return AgentResult(response=response, state=state)
     
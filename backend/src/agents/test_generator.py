@@ -295,12 +295,10 @@ class TestGeneratorAgent(BaseAgent[TestGeneratorInput, TestGeneratorOutput]):
                 )
         return self._llm
     
-    @property
-    def description(self) -> str:
-        return (
-            "Generates fair, job-relevant MCQ assessments from parsed job "
-            "descriptions, ensuring coverage of required skills and topics."
-        )
+    description = (
+        "Generates fair, job-relevant MCQ assessments from parsed job "
+        "descriptions, ensuring coverage of required skills and topics."
+    )
     
     @property
     def required_confidence_threshold(self) -> float:
@@ -327,6 +325,7 @@ class TestGeneratorAgent(BaseAgent[TestGeneratorInput, TestGeneratorOutput]):
         if state is None:
             state = PipelineState()
         
+        self._begin_run()
         try:
             result, confidence, explanation = self._process(input_data)
             
@@ -336,6 +335,8 @@ class TestGeneratorAgent(BaseAgent[TestGeneratorInput, TestGeneratorOutput]):
                 output=result,
                 confidence_score=confidence,
                 explanation=explanation,
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             
             return AgentResult(response=response, state=state)
@@ -347,6 +348,8 @@ class TestGeneratorAgent(BaseAgent[TestGeneratorInput, TestGeneratorOutput]):
                 output=None,
                 confidence_score=0.0,
                 explanation=f"Test generation failed: {str(e)}",
+                metadata=self._run_metadata(),
+                audit_trail=self._audit_trail(),
             )
             return AgentResult(response=response, state=state)
     
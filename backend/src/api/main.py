@@ -16,6 +16,7 @@ from ..agents.orchestrator import OrchestratorAgent
 from ..schemas.job import JobDescription
 from ..schemas.candidates import CandidateProfile
 from ..schemas.messages import PipelineStage
+from ..utils.timestamps import iso_timestamps
 
 
 # ---------------------
@@ -372,8 +373,10 @@ async def create_pipeline(request: PipelineCreateRequest, background_tasks: Back
     # Create pipeline
     state = orchestrator.create_pipeline(job, candidate_profiles)
     
-    # Update candidates in state with resume text
-    state.candidates = candidates_data
+    # Update candidates in state with resume text. Copy the records: the
+    # pipeline annotates its candidates in place, which must not leak into
+    # candidates_db.
+    state.candidates = [dict(c) for c in candidates_data]
     
     pipeline_id = state.pipeline_id
     orchestrators[pipeline_id] = orchestrator
@@ -402,7 +405,7 @@ async def run_pipeline(pipeline_id: str):
     orchestrator = orchestrators[pipeline_id]
     
     try:
-        final_state = orchestrator.run_pipeline()
+        final_state = await orchestrator.run_pipeline_async()
         
         pipelines_db[pipeline_id]["status"] = final_state.current_stage.value
         pipelines_db[pipeline_id]["state"] = final_state.to_dict()
@@ -426,9 +429,9 @@ async def get_pipeline(pipeline_id: str):
     
     if pipeline_id in orchestrators:
         summary = orchestrators[pipeline_id].get_pipeline_summary()
-        return {**pipeline, "summary": summary}
+        return iso_timestamps({**pipeline, "summary": summary})
     
-    return pipeline
+    return iso_timestamps(pipeline)
 
 
 @app.get("/api/pipelines/{pipeline_id}/audit", tags=["Pipeline"])
@@ -592,14 +595,14 @@ async def get_candidate_result(pipeline_id: str, candidate_id: str):
         None
     )
     
-    return {
+    return iso_timestamps({
         "candidate_id": candidate_id,
         "parsed_resume": candidate.get("parsed_resume", {}),
         "match_result": match_result,
         "test_result": test_result,
         "ranking": ranking,
         "shortlisted": candidate_id in state.shortlisted_candidates,
-    }
+    })
 
 
 # ---------------------
@@ -1,6 +1,6 @@
 # Core modules
 from .config import Settings
-from .logger import AuditLogger
+from .logger import AuditLogger, ComplianceReader, JSONLWriter
 from .registry import AgentRegistry
 
-__all__ = ["Settings", "AuditLogger", "AgentRegistry"]
+__all__ = ["Settings", "AuditLogger", "ComplianceReader", "JSONLWriter", "AgentRegistry"]
@@ -2,8 +2,9 @@
 Configuration management for the recruitment system.
 """
 
-from dataclasses import dataclass, field
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field, replace
+from functools import cache
+from typing import Any, ClassVar, Dict, Optional, Tuple
 import os
 
 
@@ -16,22 +17,39 @@ class LLMConfig:
     max_tokens: int = 2000
     api_key: Optional[str] = None  # Set via environment variable
     
+    # Environment lookups per provider, read once per process
+    _API_KEY_CACHE: ClassVar[Dict[str, Optional[str]]] = {}
+    
     def __post_init__(self):
         if not self.api_key:
-            self.api_key = os.getenv(f"{self.provider.upper()}_API_KEY")
+            try:
+                self.api_key = LLMConfig._API_KEY_CACHE[self.provider]
+            except KeyError:
+                self.api_key = LLMConfig._API_KEY_CACHE[self.provider] = os.getenv(
+                    f"{self.provider.upper()}_API_KEY"
+                )
 
 
 @dataclass
 class ScoringWeights:
-    """Weights for candidate scoring."""
+    """
+    Weights for candidate scoring.
+    
+    The sum check converts the weights to integer basis points (1/10000),
+    so it is exact integer arithmetic with the same 1% tolerance.
+    """
     skills: float = 0.4
     experience: float = 0.35
     education: float = 0.25
     
     def __post_init__(self):
-        total = self.skills + self.experience + self.education
-        if abs(total - 1.0) > 0.01:
-            raise ValueError(f"Scoring weights must sum to 1.0, got {total}")
+        total_bp = (
+            round(self.skills * 10_000)
+            + round(self.experience * 10_000)
+            + round(self.education * 10_000)
+        )
+        if abs(total_bp - 10_000) > 100:
+            raise ValueError(f"Scoring weights must sum to 1.0, got {total_bp / 10_000}")
 
 
 @dataclass
@@ -63,10 +81,13 @@ class Settings:
     max_candidates_per_job: int = 500
     top_k_candidates: int = 10
     test_questions_count: int = 20
+    parse_batch_size: int = 32  # Resumes per batched parsing call
     
     # Audit settings
     audit_log_enabled: bool = True
     audit_log_path: str = "logs/audit.jsonl"
+    audit_enabled_events: Tuple[str, ...] = ()  # Empty = log every event type
+    audit_sample_rate: float = 1.0  # Fraction of non-review events kept
     
     # Human review settings
     require_human_review_for_borderline: bool = True
@@ -99,10 +120,13 @@ class Settings:
                 "max_candidates": self.max_candidates_per_job,
                 "top_k": self.top_k_candidates,
                 "test_questions": self.test_questions_count,
+                "parse_batch_size": self.parse_batch_size,
             },
             "audit": {
                 "enabled": self.audit_log_enabled,
                 "log_path": self.audit_log_path,
+                "enabled_events": list(self.audit_enabled_events),
+                "sample_rate": self.audit_sample_rate,
             },
             "human_review": {
                 "borderline_enabled": self.require_human_review_for_borderline,
@@ -116,7 +140,24 @@ class Settings:
     
     @classmethod
     def from_env(cls) -> "Settings":
-        """Create settings from environment variables."""
+        """
+        Create settings from environment variables.
+        
+        The environment is read once per process. Each call returns its own
+        copy (nested sections included), so callers may adjust the result
+        without affecting anyone else.
+        """
+        cached = cls._from_env_cached()
+        return replace(
+            cached,
+            llm=replace(cached.llm),
+            scoring_weights=replace(cached.scoring_weights),
+            thresholds=replace(cached.thresholds),
+        )
+    
+    @classmethod
+    @cache
+    def _from_env_cached(cls) -> "Settings":
         return cls(
             llm=LLMConfig(
                 provider=os.getenv("LLM_PROVIDER", "openai"),
@@ -126,4 +167,8 @@ class Settings:
             thresholds=ThresholdConfig(
                 shortlist_threshold=float(os.getenv("SHORTLIST_THRESHOLD", "0.7")),
             ),
+            audit_enabled_events=tuple(
+                e.strip() for e in os.getenv("AUDIT_ENABLED_EVENTS", "").split(",") if e.strip()
+            ),
+            audit_sample_rate=float(os.getenv("AUDIT_SAMPLE_RATE", "1.0")),
         )
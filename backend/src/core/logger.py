@@ -4,17 +4,287 @@ Audit logging for the recruitment system.
 All decisions and actions are logged for compliance and explainability.
 """
 
+import atexit
+import itertools
 import json
-from dataclasses import asdict, dataclass
-from datetime import datetime
+import mmap
+import os
+import random
+import struct
+import sys
+import threading
+import weakref
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from uuid import uuid4
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Deque, Dict, FrozenSet, Iterable, Iterator, List, Literal, Optional, Tuple
 
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
 
-@dataclass
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Not on Windows
+    FCNTL_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from ..utils.timestamps import utc_now_iso
+
+if TYPE_CHECKING:
+    from .config import Settings
+
+# Appends up to this size go out as one os.write() on an O_APPEND fd, which
+# the kernel does not interleave with other appenders; larger ones also take
+# an exclusive flock
+ATOMIC_APPEND_SIZE = 4096
+
+# Length prefix for each record in a msgpack audit log
+_FRAME_HEADER = struct.Struct("<I")
+
+# Entry IDs are "<pid>-<counter>": unique within the process writing the log
+_entry_ctr = itertools.count()
+_pid = os.getpid()
+
+
+def _reset_entry_ids() -> None:
+    global _entry_ctr, _pid
+    _entry_ctr = itertools.count()
+    _pid = os.getpid()
+
+
+os.register_at_fork(after_in_child=_reset_entry_ids)
+
+
+class _BackgroundWriter:
+    """
+    A daemon thread that drains queued items to a write_batch callable.
+    
+    Items are handed over as a list once batch_size are queued, when
+    flush() or close() asks, or every flush_interval seconds. on_stop runs
+    on the writer thread as it exits, so whatever write_batch writes to is
+    never released while a batch is in flight.
+    
+    If write_batch raises, the writer stops: queued items are dropped, and
+    append() and flush() raise a RuntimeError chained to the error.
+    """
+    
+    def __init__(
+        self,
+        label: str,
+        thread_name: str,
+        write_batch: Callable[[List[Any]], None],
+        on_stop: Callable[[], None],
+        batch_size: int,
+        flush_interval: float,
+    ):
+        self.label = label  # For error messages, e.g. "JSONLWriter for <path>"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._write_batch = write_batch
+        self._on_stop = on_stop
+        
+        self._queue: Deque[Any] = deque()
+        self._cond = threading.Condition()
+        self._pending = 0  # Appended but not yet written
+        self._flush_requested = False
+        self._closed = False
+        self._stopped = False  # Writer thread has exited
+        self._error: Optional[BaseException] = None
+        
+        self._thread = threading.Thread(target=self._run, name=thread_name, daemon=True)
+        self._thread.start()
+    
+    @property
+    def closed(self) -> bool:
+        return self._closed
+    
+    def append(self, item: Any) -> None:
+        """Queue an item for writing."""
+        with self._cond:
+            self._raise_if_failed()
+            if self._closed:
+                raise ValueError(f"{self.label} is closed")
+            self._queue.append(item)
+            self._pending += 1
+            if len(self._queue) >= self.batch_size:
+                self._cond.notify_all()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every item appended so far is written.
+        
+        Returns:
+            False if the timeout expired first
+        """
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            done = self._cond.wait_for(lambda: self._pending == 0 or self._stopped, timeout)
+            self._raise_if_failed()
+            return done
+    
+    def close(self) -> None:
+        """Write any queued items and stop the writer thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        # A finalizer calling close() may run on the writer thread itself
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+    
+    def _raise_if_failed(self) -> None:
+        # Caller holds self._cond
+        if self._error is not None:
+            raise RuntimeError(f"{self.label} failed") from self._error
+    
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: self._closed
+                        or self._flush_requested
+                        or len(self._queue) >= self.batch_size,
+                        timeout=self.flush_interval,
+                    )
+                    batch = list(self._queue)
+                    self._queue.clear()
+                    self._flush_requested = False
+                    closing = self._closed
+                
+                if batch:
+                    try:
+                        self._write_batch(batch)
+                    except Exception as exc:
+                        with self._cond:
+                            self._error = exc
+                        break
+                    with self._cond:
+                        self._pending -= len(batch)
+                        self._cond.notify_all()
+                
+                if closing:
+                    break
+        finally:
+            # Whatever ended the loop, stop accepting items and wake flush()
+            with self._cond:
+                self._closed = True
+                self._stopped = True
+                self._queue.clear()
+                self._pending = 0
+                self._cond.notify_all()
+            self._on_stop()
+
+
+class JSONLWriter:
+    """
+    Append records to a JSONL file from a background thread.
+    
+    append() only enqueues the record; the writer thread serializes queued
+    records and writes each batch with a single os.write() on an O_APPEND
+    descriptor, so callers never block on JSON encoding or disk I/O.
+    Batches go out once batch_size records are queued, or every
+    flush_interval seconds, whichever comes first. An optional render
+    callable turns queued records into their serialized form on the
+    writer thread, keeping that work off the caller's path too.
+    
+    If a batch fails to render or write, the writer stops: queued records
+    are dropped, and append() and flush() raise a RuntimeError carrying
+    the original error.
+    
+    Use for_path() to share one writer (and one thread) per file.
+    """
+    
+    _instances: ClassVar[Dict[Path, "JSONLWriter"]] = {}
+    _instances_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+        render: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.render = render
+        
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._writer = _BackgroundWriter(
+            label=f"JSONLWriter for {self.path}",
+            thread_name=f"jsonl-writer:{self.path.name}",
+            write_batch=self._write_batch,
+            on_stop=self._close_fd,
+            batch_size=batch_size,
+            flush_interval=flush_interval,
+        )
+        atexit.register(self.close)
+    
+    @classmethod
+    def for_path(
+        cls,
+        path: str,
+        render: Optional[Callable[[Any], Dict[str, Any]]] = None,
+    ) -> "JSONLWriter":
+        """
+        Return the shared writer for a file, creating it on first use.
+        
+        The render callable only applies when the writer is created;
+        every producer of a given file is expected to use the same one.
+        """
+        key = Path(path).resolve()
+        with cls._instances_lock:
+            writer = cls._instances.get(key)
+            if writer is None or writer._writer.closed:
+                writer = cls._instances[key] = cls(str(key), render=render)
+            return writer
+    
+    def append(self, record: Any) -> None:
+        """Queue a record for writing."""
+        self._writer.append(record)
+    
+    def flush(self) -> None:
+        """Block until every record appended so far is written."""
+        self._writer.flush()
+    
+    def close(self) -> None:
+        """Write any queued records and stop the writer thread."""
+        self._writer.close()
+    
+    def _write_batch(self, batch: List[Any]) -> None:
+        if self.render is not None:
+            batch = [self.render(r) for r in batch]
+        data = "".join(json.dumps(r, default=str) + "\n" for r in batch).encode()
+        view = memoryview(data)
+        while view:
+            written = os.write(self._fd, view)
+            view = view[written:]
+    
+    def _close_fd(self) -> None:
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+
+
+@dataclass(slots=True)
 class AuditEntry:
-    """A single audit log entry."""
+    """
+    A single audit log entry.
+    
+    entry_id is only unique among the logs of one process run (pid plus
+    a counter); pair it with timestamp when merging logs from elsewhere.
+    """
     entry_id: str
     timestamp: str
     event_type: str
@@ -28,13 +298,207 @@ class AuditEntry:
     confidence: Optional[float]
     requires_review: bool
     
+    def reset(
+        self,
+        entry_id: str,
+        timestamp: str,
+        event_type: str,
+        pipeline_id: Optional[str],
+        job_id: Optional[str],
+        candidate_id: Optional[str],
+        agent_type: Optional[str],
+        action: str,
+        details: Dict[str, Any],
+        outcome: Optional[str],
+        confidence: Optional[float],
+        requires_review: bool,
+    ) -> None:
+        """Overwrite every field, so pooled entries can be reused."""
+        self.entry_id = entry_id
+        self.timestamp = timestamp
+        self.event_type = event_type
+        self.pipeline_id = pipeline_id
+        self.job_id = job_id
+        self.candidate_id = candidate_id
+        self.agent_type = agent_type
+        self.action = action
+        self.details = details
+        self.outcome = outcome
+        self.confidence = confidence
+        self.requires_review = requires_review
+    
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Built by hand: asdict() would deep-copy `details` on every write
+        return {
+            "entry_id": self.entry_id,
+            "timestamp": self.timestamp,
+            "event_type": self.event_type,
+            "pipeline_id": self.pipeline_id,
+            "job_id": self.job_id,
+            "candidate_id": self.candidate_id,
+            "agent_type": self.agent_type,
+            "action": self.action,
+            "details": self.details,
+            "outcome": self.outcome,
+            "confidence": self.confidence,
+            "requires_review": self.requires_review,
+        }
     
     def to_json(self) -> str:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(self, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
         return json.dumps(self.to_dict())
 
 
+class ComplianceReader:
+    """
+    Scan an audit log file without loading it into memory.
+    
+    The file is memory-mapped and walked record by record. When filtering
+    by pipeline, records that do not contain the pipeline ID's bytes are
+    skipped without being decoded.
+    """
+    
+    def __init__(self, path: str, serializer: Literal["json", "msgpack"] = "json"):
+        if serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            raise ImportError("msgpack is required to read msgpack audit logs")
+        self.path = Path(path)
+        self.serializer = serializer
+    
+    def entries(self, pipeline_id: Optional[str] = None) -> Iterator[AuditEntry]:
+        """Yield entries in file order, optionally only those of one pipeline."""
+        for record in self.records(pipeline_id):
+            yield AuditEntry(**record)
+    
+    def records(self, pipeline_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Like entries(), but yield the decoded dicts (AuditEntry.to_dict() form)."""
+        needle = pipeline_id.encode("utf-8") if pipeline_id else None
+        for raw in self._records():
+            if needle is not None and needle not in raw:
+                continue
+            record = self._decode(raw)
+            if pipeline_id is None or record["pipeline_id"] == pipeline_id:
+                yield record
+    
+    def _decode(self, record: bytes) -> Dict[str, Any]:
+        if self.serializer == "msgpack":
+            return msgpack.unpackb(record, raw=False)
+        return json.loads(record)
+    
+    def _records(self) -> Iterator[bytes]:
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            pos = 0
+            if self.serializer == "msgpack":
+                header_size = _FRAME_HEADER.size
+                while pos + header_size <= size:
+                    (length,) = _FRAME_HEADER.unpack_from(mm, pos)
+                    pos += header_size
+                    yield mm[pos:pos + length]
+                    pos += length
+            else:
+                while pos < size:
+                    end = mm.find(b"\n", pos)
+                    if end == -1:
+                        end = size
+                    record = mm[pos:end]
+                    pos = end + 1
+                    if record.strip():
+                        yield record
+
+
+class _AuditLogFile:
+    """
+    The O_APPEND descriptor behind an AuditLogger.
+    
+    Held apart from the logger so the background writer thread and the
+    logger's finalizer can use it without keeping the logger alive.
+    """
+    
+    def __init__(self, path: Path, buffer_size: int, fsync_every: int):
+        self.buffer_size = buffer_size
+        self.fsync_every = fsync_every
+        self._unsynced = 0
+        self._fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o640)
+        self._fd_closed = False
+        self._large_write_lock = threading.Lock()
+    
+    def write_items(self, items: List[Tuple[List[bytes], int]]) -> None:
+        """Write queued (records, record_count) items from the background writer."""
+        records: List[bytes] = []
+        count = 0
+        for item_records, item_count in items:
+            records.extend(item_records)
+            count += item_count
+        self.write(records, count)
+    
+    def write(self, records: List[bytes], count: int) -> None:
+        """Write encoded records, coalesced up to buffer_size per write."""
+        payload: List[bytes] = []
+        size = 0
+        for record in records:
+            if payload and size + len(record) > self.buffer_size:
+                self._write_payload(b"".join(payload))
+                payload.clear()
+                size = 0
+            payload.append(record)
+            size += len(record)
+        if payload:
+            self._write_payload(b"".join(payload))
+        
+        if self.fsync_every:
+            self._unsynced += count
+            if self._unsynced >= self.fsync_every:
+                self.sync()
+    
+    def _write_payload(self, payload: bytes) -> None:
+        if len(payload) <= ATOMIC_APPEND_SIZE:
+            written = os.write(self._fd, payload)
+            if written == len(payload):
+                return
+            payload = payload[written:]  # Short write; finish under the lock
+        
+        with self._large_write_lock:
+            if FCNTL_AVAILABLE:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(self._fd, view):]
+            finally:
+                if FCNTL_AVAILABLE:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+    
+    def sync(self) -> None:
+        os.fsync(self._fd)
+        self._unsynced = 0
+    
+    def close(self) -> None:
+        """Fsync (when fsync_every is set) and close; tolerates a broken descriptor."""
+        if self._fd_closed:
+            return
+        self._fd_closed = True
+        try:
+            if self.fsync_every:
+                os.fsync(self._fd)
+        except OSError:
+            pass
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+
+
+def _close_audit_log(log_file: _AuditLogFile, writer: Optional[_BackgroundWriter]) -> None:
+    """Finalizer for an AuditLogger: drain the writer, which closes the file."""
+    if writer is None:
+        log_file.close()
+    else:
+        writer.close()
+
+
 class AuditLogger:
     """
     Structured audit logging for compliance and explainability.
@@ -46,13 +510,136 @@ class AuditLogger:
     - Configuration changes
     - Error conditions
     
-    Logs are stored in JSONL format for easy processing.
+    Logs are stored in JSONL format for easy processing, or, with
+    serializer="msgpack", as length-prefixed MessagePack records, which
+    are smaller and cheaper to encode; read those back with
+    iter_entries(). If msgpack is not installed the logger falls back to
+    JSONL.
+    
+    Events can be filtered before any entry is built: only event types in
+    enabled_events are kept (all types when None), and sample_rate keeps
+    a random fraction of the rest. Events with requires_review=True are
+    always logged.
+    
+    Only the most recent max_in_memory entries are kept for get_entries()
+    and the review queue, indexed by pipeline and event type so queries
+    only touch matching entries; the full history lives in the log file, which
+    export_for_compliance() scans with a ComplianceReader.
+    
+    With retain_entries=False nothing is kept in memory (get_entries() and
+    friends see nothing) and written entries are recycled through a small
+    pool, so steady-state logging allocates no AuditEntry objects. The
+    entry returned by log() is then only valid until the next log call.
+    
+    Entries are serialized on the caller's thread and, by default, handed
+    to a background writer thread, so log() never waits on file I/O. The
+    writer coalesces queued records into writes of up to buffer_size
+    bytes. The log is an O_APPEND descriptor written with os.write(),
+    split only at record boundaries, so several processes can append to
+    one log without tearing records. flush() waits for the writer;
+    fsync_every additionally fsyncs every N entries. If the writer fails,
+    it stops, and log(), flush() and flush_and_wait() raise a
+    RuntimeError carrying the I/O error instead of queueing entries that
+    will never be written.
     """
     
-    def __init__(self, log_path: str = "logs/audit.jsonl"):
+    # Event types written by the log_* helpers; prune this to build an
+    # enabled_events set, e.g. DEFAULT_ENABLED_EVENTS - {"decision"}
+    DEFAULT_ENABLED_EVENTS: ClassVar[FrozenSet[str]] = frozenset(
+        {"decision", "decision_gate", "review_request", "bias_finding"}
+    )
+    
+    def __init__(
+        self,
+        log_path: str = "logs/audit.jsonl",
+        buffer_size: int = 1 << 20,
+        fsync_every: int = 0,
+        serializer: Literal["json", "msgpack"] = "json",
+        enabled_events: Optional[Iterable[str]] = None,
+        sample_rate: float = 1.0,
+        retain_entries: bool = True,
+        pool_size: int = 1024,
+        max_in_memory: int = 10_000,
+        background: bool = True,
+    ):
+        """
+        Args:
+            log_path: Log file to append to
+            buffer_size: Max bytes of queued records coalesced into one write
+            fsync_every: Flush and fsync after this many entries (0 = never;
+                rely on flush()/close())
+            serializer: Record format, "json" (JSONL) or "msgpack"
+            enabled_events: Event types to log (None = all)
+            sample_rate: Fraction of enabled events to keep [0.0-1.0]
+            retain_entries: Keep logged entries in memory for queries
+            pool_size: Max recycled entries kept when not retaining
+            max_in_memory: Max recent entries kept for in-memory queries
+            background: Write from a background thread instead of inline
+        """
+        if serializer not in ("json", "msgpack"):
+            raise ValueError(f"Unknown audit log serializer: {serializer!r}")
+        if serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            serializer = "json"
+        
         self.log_path = Path(log_path)
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
-        self._entries: List[AuditEntry] = []
+        self.serializer = serializer
+        self._enabled_events = frozenset(enabled_events) if enabled_events is not None else None
+        self._sample_rate = sample_rate
+        self.retain_entries = retain_entries and max_in_memory > 0
+        self._entries: Deque[AuditEntry] = deque(maxlen=max_in_memory)
+        # Indexes over _entries, each in log order
+        self._by_pipeline: Dict[str, Deque[AuditEntry]] = defaultdict(deque)
+        self._by_event_type: Dict[str, Deque[AuditEntry]] = defaultdict(deque)
+        self._review_queue: Deque[AuditEntry] = deque()
+        self._pool: Deque[AuditEntry] = deque(maxlen=pool_size)
+        if serializer == "msgpack":
+            self._pack = msgpack.Packer(use_bin_type=True).pack
+            self._encode = self._encode_msgpack
+        else:
+            self._encode = self._encode_json
+        self._file = _AuditLogFile(self.log_path, buffer_size, fsync_every)
+        self._closed = False
+        
+        self._writer: Optional[_BackgroundWriter] = None
+        if background:
+            # Neither the writer nor the finalizer refers to self, so an
+            # unused logger is still collected (and its thread stopped)
+            self._writer = _BackgroundWriter(
+                label=f"AuditLogger for {self.log_path}",
+                thread_name=f"audit-writer:{self.log_path.name}",
+                write_batch=self._file.write_items,
+                on_stop=self._file.close,
+                batch_size=1,  # Write as soon as anything is queued
+                flush_interval=1.0,
+            )
+        # Also runs at interpreter exit
+        self._finalizer = weakref.finalize(self, _close_audit_log, self._file, self._writer)
+    
+    @property
+    def buffer_size(self) -> int:
+        return self._file.buffer_size
+    
+    @property
+    def fsync_every(self) -> int:
+        return self._file.fsync_every
+    
+    @classmethod
+    def from_settings(cls, settings: "Settings") -> "AuditLogger":
+        """Create a logger from the audit section of Settings."""
+        return cls(
+            log_path=settings.audit_log_path,
+            enabled_events=settings.audit_enabled_events or None,
+            sample_rate=settings.audit_sample_rate,
+        )
+    
+    def _is_enabled(self, event_type: str, requires_review: bool = False) -> bool:
+        """Whether an event would be logged; checked before building its details."""
+        if requires_review:
+            return True
+        if self._enabled_events is not None and event_type not in self._enabled_events:
+            return False
+        return self._sample_rate >= 1.0 or random.random() < self._sample_rate
     
     def log(
         self,
@@ -66,7 +653,7 @@ class AuditLogger:
         outcome: Optional[str] = None,
         confidence: Optional[float] = None,
         requires_review: bool = False,
-    ) -> AuditEntry:
+    ) -> Optional[AuditEntry]:
         """
         Log an audit event.
         
@@ -83,28 +670,100 @@ class AuditLogger:
             requires_review: Whether human review is needed
         
         Returns:
-            The created AuditEntry
+            The created AuditEntry, or None if the event was filtered out
         """
-        entry = AuditEntry(
-            entry_id=uuid4().hex,
-            timestamp=datetime.utcnow().isoformat(),
-            event_type=event_type,
-            pipeline_id=pipeline_id,
-            job_id=job_id,
-            candidate_id=candidate_id,
-            agent_type=agent_type,
-            action=action,
-            details=details,
-            outcome=outcome,
-            confidence=confidence,
-            requires_review=requires_review,
+        if not self._is_enabled(event_type, requires_review):
+            return None
+        return self._emit(
+            event_type, action, details, pipeline_id, job_id, candidate_id,
+            agent_type, outcome, confidence, requires_review,
+        )
+    
+    def _emit(
+        self,
+        event_type: str,
+        action: str,
+        details: Dict[str, Any],
+        pipeline_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        candidate_id: Optional[str] = None,
+        agent_type: Optional[str] = None,
+        outcome: Optional[str] = None,
+        confidence: Optional[float] = None,
+        requires_review: bool = False,
+    ) -> AuditEntry:
+        """Build, write and retain an entry that already passed _is_enabled()."""
+        entry = self._make_entry(
+            event_type, action, details, pipeline_id, job_id, candidate_id,
+            agent_type, outcome, confidence, requires_review,
         )
         
-        self._entries.append(entry)
         self._write_entry(entry)
+        if self.retain_entries:
+            self._retain(entry)
+        else:
+            self._pool.append(entry)
         
         return entry
     
+    def log_many(self, events: Iterable[Dict[str, Any]]) -> List[AuditEntry]:
+        """
+        Log several events with a single write.
+        
+        Args:
+            events: Dicts of log() keyword arguments, one per event
+        
+        Returns:
+            The created AuditEntries, in order (filtered events are skipped)
+        """
+        entries = [
+            self._make_entry(**event)
+            for event in events
+            if self._is_enabled(event["event_type"], event.get("requires_review", False))
+        ]
+        if entries:
+            self._write([self._encode(entry) for entry in entries], len(entries))
+            if self.retain_entries:
+                for entry in entries:
+                    self._retain(entry)
+            else:
+                self._pool.extend(entries)
+        return entries
+    
+    def _make_entry(
+        self,
+        event_type: str,
+        action: str,
+        details: Dict[str, Any],
+        pipeline_id: Optional[str] = None,
+        job_id: Optional[str] = None,
+        candidate_id: Optional[str] = None,
+        agent_type: Optional[str] = None,
+        outcome: Optional[str] = None,
+        confidence: Optional[float] = None,
+        requires_review: bool = False,
+    ) -> AuditEntry:
+        # The pool only fills when entries are not retained
+        entry = self._pool.pop() if self._pool else AuditEntry.__new__(AuditEntry)
+        # event_type, agent_type and outcome come from small closed sets;
+        # interning keeps one str per value and makes the index and filter
+        # comparisons identity checks
+        entry.reset(
+            f"{_pid}-{next(_entry_ctr):x}",
+            utc_now_iso(),
+            sys.intern(event_type),
+            pipeline_id,
+            job_id,
+            candidate_id,
+            agent_type and sys.intern(agent_type),
+            action,
+            details,
+            outcome and sys.intern(outcome),
+            confidence,
+            requires_review,
+        )
+        return entry
+    
     def log_decision(
         self,
         agent_type: str,
@@ -114,9 +773,12 @@ class AuditLogger:
         pipeline_id: Optional[str] = None,
         job_id: Optional[str] = None,
         candidate_id: Optional[str] = None,
-    ) -> AuditEntry:
+    ) -> Optional[AuditEntry]:
         """Log an agent decision."""
-        return self.log(
+        requires_review = confidence < 0.7
+        if not self._is_enabled("decision", requires_review):
+            return None
+        return self._emit(
             event_type="decision",
             action=decision,
             details={"explanation": explanation},
@@ -126,7 +788,7 @@ class AuditLogger:
             agent_type=agent_type,
             outcome="recorded",
             confidence=confidence,
-            requires_review=confidence < 0.7,
+            requires_review=requires_review,
         )
     
     def log_decision_gate(
@@ -138,21 +800,25 @@ class AuditLogger:
         pipeline_id: Optional[str] = None,
         job_id: Optional[str] = None,
         candidate_id: Optional[str] = None,
-    ) -> AuditEntry:
+    ) -> Optional[AuditEntry]:
         """Log a decision gate evaluation."""
-        return self.log(
+        margin = abs(actual_value - threshold)
+        requires_review = margin < 0.1
+        if not self._is_enabled("decision_gate", requires_review):
+            return None
+        return self._emit(
             event_type="decision_gate",
             action=f"gate_{gate_name}",
             details={
                 "threshold": threshold,
                 "actual_value": actual_value,
-                "margin": abs(actual_value - threshold),
+                "margin": margin,
             },
             pipeline_id=pipeline_id,
             job_id=job_id,
             candidate_id=candidate_id,
             outcome="passed" if passed else "failed",
-            requires_review=abs(actual_value - threshold) < 0.1,
+            requires_review=requires_review,
         )
     
     def log_human_review_request(
@@ -162,9 +828,10 @@ class AuditLogger:
         pipeline_id: Optional[str] = None,
         job_id: Optional[str] = None,
         candidate_id: Optional[str] = None,
-    ) -> AuditEntry:
+    ) -> Optional[AuditEntry]:
         """Log a human review request."""
-        return self.log(
+        # Review requests are always logged, so there is nothing to gate
+        return self._emit(
             event_type="review_request",
             action="human_review_requested",
             details={"reason": reason, "context": context},
@@ -183,9 +850,12 @@ class AuditLogger:
         affected_candidates: List[str],
         pipeline_id: Optional[str] = None,
         job_id: Optional[str] = None,
-    ) -> AuditEntry:
+    ) -> Optional[AuditEntry]:
         """Log a bias audit finding."""
-        return self.log(
+        requires_review = severity in ("high", "critical")
+        if not self._is_enabled("bias_finding", requires_review):
+            return None
+        return self._emit(
             event_type="bias_finding",
             action=f"bias_{finding_type}",
             details={
@@ -196,13 +866,99 @@ class AuditLogger:
             pipeline_id=pipeline_id,
             job_id=job_id,
             outcome="flagged",
-            requires_review=severity in ["high", "critical"],
+            requires_review=requires_review,
         )
     
     def _write_entry(self, entry: AuditEntry) -> None:
         """Write an entry to the log file."""
-        with open(self.log_path, "a") as f:
-            f.write(entry.to_json() + "\n")
+        self._write([self._encode(entry)], 1)
+    
+    def _write(self, records: List[bytes], count: int) -> None:
+        if self._closed:
+            raise ValueError(f"AuditLogger for {self.log_path} is closed")
+        if self._writer is not None:
+            self._writer.append((records, count))
+        else:
+            self._file.write(records, count)
+    
+    @staticmethod
+    def _encode_json(entry: AuditEntry) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(entry, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        return (entry.to_json() + "\n").encode("utf-8")
+    
+    def _encode_msgpack(self, entry: AuditEntry) -> bytes:
+        buf = self._pack(entry.to_dict())
+        return _FRAME_HEADER.pack(len(buf)) + buf
+    
+    def _retain(self, entry: AuditEntry) -> None:
+        """Keep an entry in memory and index it, evicting the oldest if full."""
+        if len(self._entries) == self._entries.maxlen:
+            # The evicted entry is also the oldest in each of its indexes
+            self._unindex(self._entries[0])
+        self._entries.append(entry)
+        if entry.pipeline_id:
+            self._by_pipeline[entry.pipeline_id].append(entry)
+        self._by_event_type[entry.event_type].append(entry)
+        if entry.requires_review:
+            self._review_queue.append(entry)
+    
+    def _unindex(self, entry: AuditEntry) -> None:
+        if entry.pipeline_id:
+            self._pop_oldest(self._by_pipeline, entry.pipeline_id)
+        self._pop_oldest(self._by_event_type, entry.event_type)
+        if entry.requires_review:
+            self._review_queue.popleft()
+    
+    @staticmethod
+    def _pop_oldest(index: Dict[str, Deque[AuditEntry]], key: str) -> None:
+        bucket = index[key]
+        bucket.popleft()
+        if not bucket:
+            del index[key]
+    
+    @staticmethod
+    def iter_entries(
+        path: str, serializer: Literal["json", "msgpack"] = "json"
+    ) -> Iterator[AuditEntry]:
+        """
+        Replay the entries stored in an audit log file.
+        
+        Args:
+            path: Log file written by an AuditLogger
+            serializer: The serializer the file was written with
+        """
+        return ComplianceReader(path, serializer).entries()
+    
+    def flush(self) -> None:
+        """Wait until queued entries are written to the log file."""
+        if not self._closed and self._writer is not None:
+            self._writer.flush()
+    
+    def flush_and_wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every entry logged so far is written and flushed.
+        
+        Returns:
+            False if the timeout expired first
+        
+        Raises:
+            RuntimeError: If the background writer failed
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+    
+    def close(self) -> None:
+        """Write queued entries and close the log file."""
+        self._closed = True
+        self._finalizer()
+    
+    def __enter__(self) -> "AuditLogger":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def get_entries(
         self,
@@ -210,36 +966,76 @@ class AuditLogger:
         event_type: Optional[str] = None,
         requires_review: Optional[bool] = None,
     ) -> List[AuditEntry]:
-        """Query audit entries with filters."""
-        results = self._entries
-        
+        """Query recent (in-memory) audit entries with filters."""
+        # Start from the most selective index, then filter on the rest
         if pipeline_id:
-            results = [e for e in results if e.pipeline_id == pipeline_id]
-        if event_type:
-            results = [e for e in results if e.event_type == event_type]
-        if requires_review is not None:
-            results = [e for e in results if e.requires_review == requires_review]
+            results = self._by_pipeline.get(pipeline_id, ())
+        elif event_type:
+            results = self._by_event_type.get(event_type, ())
+            event_type = None
+        elif requires_review:
+            results = self._review_queue
+            requires_review = None
+        else:
+            results = self._entries
         
-        return results
+        return [
+            e for e in results
+            if (not event_type or e.event_type == event_type)
+            and (requires_review is None or e.requires_review == requires_review)
+        ]
     
     def get_review_queue(self) -> List[AuditEntry]:
         """Get all entries requiring human review."""
-        return [e for e in self._entries if e.requires_review]
+        return list(self._review_queue)
+    
+    def iter_export_for_compliance(self, pipeline_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream a pipeline's audit entries as dicts, e.g. for an NDJSON response."""
+        self.flush()
+        return ComplianceReader(self.log_path, self.serializer).records(pipeline_id)
     
-    def export_for_compliance(self, pipeline_id: str) -> Dict[str, Any]:
-        """Export all audit data for a pipeline for compliance review."""
-        entries = self.get_entries(pipeline_id=pipeline_id)
+    def export_for_compliance(
+        self, pipeline_id: str, include_entries: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Export all audit data for a pipeline for compliance review.
         
-        return {
+        The log is read in a single pass that also fills the summary; with
+        include_entries=False only the counts are kept.
+        """
+        summary = {
+            "decisions": 0,
+            "gates_passed": 0,
+            "gates_failed": 0,
+            "review_requests": 0,
+            "bias_findings": 0,
+        }
+        entries: List[Dict[str, Any]] = []
+        total = 0
+        for record in self.iter_export_for_compliance(pipeline_id):
+            total += 1
+            event_type = record["event_type"]
+            if event_type == "decision":
+                summary["decisions"] += 1
+            elif event_type == "decision_gate":
+                if record["outcome"] == "passed":
+                    summary["gates_passed"] += 1
+                elif record["outcome"] == "failed":
+                    summary["gates_failed"] += 1
+            elif event_type == "review_request":
+                summary["review_requests"] += 1
+            elif event_type == "bias_finding":
+                summary["bias_findings"] += 1
+            if include_entries:
+                entries.append(record)
+        
+        export = {
             "pipeline_id": pipeline_id,
-            "export_timestamp": datetime.utcnow().isoformat(),
-            "total_entries": len(entries),
-            "entries": [e.to_dict() for e in entries],
-            "summary": {
-                "decisions": len([e for e in entries if e.event_type == "decision"]),
-                "gates_passed": len([e for e in entries if e.event_type == "decision_gate" and e.outcome == "passed"]),
-                "gates_failed": len([e for e in entries if e.event_type == "decision_gate" and e.outcome == "failed"]),
-                "review_requests": len([e for e in entries if e.event_type == "review_request"]),
-                "bias_findings": len([e for e in entries if e.event_type == "bias_finding"]),
-            },
+            "export_timestamp": datetime.now(timezone.utc).isoformat(),
+            "total_entries": total,
+            "entries": entries,
+            "summary": summary,
         }
+        if not include_entries:
+            del export["entries"]
+        return export
@@ -4,10 +4,13 @@ Agent registry for dynamic agent management.
 Allows registration and discovery of agents for framework integration.
 """
 
+import threading
 from typing import Any, Dict, List, Optional, Type
 
 from ..agents.base import BaseAgent
 
+_singleton_lock = threading.Lock()
+
 
 class AgentRegistry:
     """
@@ -23,11 +26,17 @@ class AgentRegistry:
     _instance: Optional["AgentRegistry"] = None
     
     def __new__(cls) -> "AgentRegistry":
-        """Singleton pattern for global registry."""
+        """Singleton pattern for global registry (double-checked locking)."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._agents: Dict[str, Type[BaseAgent]] = {}
-            cls._instance._instances: Dict[str, BaseAgent] = {}
+            with _singleton_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._agents: Dict[str, Type[BaseAgent]] = {}
+                    instance._instances: Dict[str, BaseAgent] = {}
+                    instance._capabilities_cache: Optional[Dict[str, str]] = None
+                    instance._lock = threading.RLock()
+                    # Publish only once fully initialized
+                    cls._instance = instance
         return cls._instance
     
     def register(self, agent_class: Type[BaseAgent]) -> None:
@@ -38,7 +47,9 @@ class AgentRegistry:
             agent_class: The agent class to register
         """
         name = agent_class.__name__
-        self._agents[name] = agent_class
+        with self._lock:
+            self._agents[name] = agent_class
+            self._capabilities_cache = None
     
     def get_agent_class(self, name: str) -> Optional[Type[BaseAgent]]:
         """Get an agent class by name."""
@@ -48,13 +59,18 @@ class AgentRegistry:
         """
         Get or create an agent instance.
         
-        Uses lazy instantiation and caching.
+        Uses lazy instantiation and caching; each agent is created at most
+        once even when several threads ask for it concurrently.
         """
-        if name not in self._instances:
-            agent_class = self._agents.get(name)
-            if agent_class:
-                self._instances[name] = agent_class()
-        return self._instances.get(name)
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    agent_class = self._agents.get(name)
+                    if agent_class:
+                        instance = self._instances[name] = agent_class()
+        return instance
     
     def list_agents(self) -> List[str]:
         """List all registered agent names."""
@@ -62,16 +78,19 @@ class AgentRegistry:
     
     def get_agent_capabilities(self) -> Dict[str, str]:
         """Get descriptions of all registered agents."""
-        capabilities = {}
-        for name, agent_class in self._agents.items():
-            instance = agent_class()
-            capabilities[name] = instance.description
-        return capabilities
+        # description is a class attribute, so no agent is instantiated
+        if self._capabilities_cache is None:
+            self._capabilities_cache = {
+                name: agent_class.description for name, agent_class in self._agents.items()
+            }
+        return dict(self._capabilities_cache)
     
     def clear(self) -> None:
         """Clear the registry (mainly for testing)."""
-        self._agents.clear()
-        self._instances.clear()
+        with self._lock:
+            self._agents.clear()
+            self._instances.clear()
+            self._capabilities_cache = None
 
 
 # Auto-register all agents on import
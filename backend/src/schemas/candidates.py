@@ -5,13 +5,21 @@ These schemas define the data structures for candidate information
 as it flows through the various stages of evaluation.
 """
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
+from ..utils.timestamps import to_ts_ms, utc_now_iso
 
-@dataclass
+
+def _intern(value: Any) -> Any:
+    """sys.intern() for strings; other values (e.g. a null from the LLM) pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class CandidateProfile:
     """
     Basic candidate information.
@@ -23,25 +31,26 @@ class CandidateProfile:
     anonymized_id: str = ""  # Used for blind review
     email_hash: str = ""  # Hashed for privacy
     resume_file_path: str = ""
-    application_date: datetime = field(default_factory=datetime.utcnow)
+    application_date: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     
     # Consent tracking (GDPR compliance)
     data_consent_given: bool = False
     consent_timestamp: Optional[datetime] = None
 
     def to_dict(self) -> Dict[str, Any]:
+        # Datetimes go out as epoch-ms ints; the API formats them for display
         return {
             "candidate_id": self.candidate_id,
             "anonymized_id": self.anonymized_id,
             "email_hash": self.email_hash,
             "resume_file_path": self.resume_file_path,
-            "application_date": self.application_date.isoformat(),
+            "application_date_ms": to_ts_ms(self.application_date),
             "data_consent_given": self.data_consent_given,
-            "consent_timestamp": self.consent_timestamp.isoformat() if self.consent_timestamp else None,
+            "consent_timestamp_ms": to_ts_ms(self.consent_timestamp) if self.consent_timestamp else None,
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillExtraction:
     """A skill extracted from a resume with confidence."""
     skill_name: str = ""
@@ -50,6 +59,11 @@ class SkillExtraction:
     evidence: str = ""  # Quote from resume supporting this
     confidence: float = 0.0
 
+    def __post_init__(self) -> None:
+        # Small closed vocabularies: share one str object per value
+        self.category = _intern(self.category)
+        self.proficiency_level = _intern(self.proficiency_level)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "skill_name": self.skill_name,
@@ -60,7 +74,7 @@ class SkillExtraction:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperienceEntry:
     """A work experience entry from a resume."""
     company_anonymized: str = ""  # Company name removed for blind review
@@ -81,7 +95,7 @@ class ExperienceEntry:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EducationEntry:
     """An education entry from a resume."""
     degree: str = ""
@@ -102,7 +116,7 @@ class EducationEntry:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedResume:
     """
     Structured representation of a parsed resume.
@@ -111,7 +125,7 @@ class ParsedResume:
     or anonymized to support blind evaluation.
     """
     candidate_id: str = ""
-    parsing_timestamp: datetime = field(default_factory=datetime.utcnow)
+    parsing_timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     parsing_confidence: float = 0.0
     
     # Extracted content
@@ -133,7 +147,7 @@ class ParsedResume:
     def to_dict(self) -> Dict[str, Any]:
         return {
             "candidate_id": self.candidate_id,
-            "parsing_timestamp": self.parsing_timestamp.isoformat(),
+            "parsing_timestamp_ms": to_ts_ms(self.parsing_timestamp),
             "parsing_confidence": self.parsing_confidence,
             "professional_summary": self.professional_summary,
             "skills": [s.to_dict() for s in self.skills],
@@ -148,7 +162,7 @@ class ParsedResume:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillMatch:
     """How well a candidate's skill matches a JD requirement."""
     required_skill: str = ""
@@ -157,6 +171,9 @@ class SkillMatch:
     match_score: float = 0.0
     explanation: str = ""
 
+    def __post_init__(self) -> None:
+        self.match_type = _intern(self.match_type)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "required_skill": self.required_skill,
@@ -167,7 +184,7 @@ class SkillMatch:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """
     Result of matching a candidate's resume against a job description.
@@ -176,7 +193,7 @@ class MatchResult:
     """
     candidate_id: str = ""
     job_id: str = ""
-    match_timestamp: datetime = field(default_factory=datetime.utcnow)
+    match_timestamp: str = field(default_factory=utc_now_iso)  # ISO 8601, UTC
     
     # Overall scores
     overall_match_score: float = 0.0  # Weighted combination [0.0-1.0]
@@ -212,7 +229,7 @@ class MatchResult:
         return {
             "candidate_id": self.candidate_id,
             "job_id": self.job_id,
-            "match_timestamp": self.match_timestamp.isoformat(),
+            "match_timestamp": self.match_timestamp,
             "overall_match_score": self.overall_match_score,
             "confidence": self.confidence,
             "skills_match_score": self.skills_match_score,
@@ -231,8 +248,13 @@ class MatchResult:
             "bias_flags": self.bias_flags,
         }
 
+    @property
+    def match_datetime(self) -> datetime:
+        """match_timestamp parsed, for code that needs datetime arithmetic."""
+        return datetime.fromisoformat(self.match_timestamp)
+
 
-@dataclass
+@dataclass(slots=True)
 class TestResponse:
     """A candidate's response to a single test question."""
     question_id: str = ""
@@ -251,7 +273,7 @@ class TestResponse:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     """
     Complete test results for a candidate.
@@ -259,7 +281,7 @@ class TestResult:
     candidate_id: str = ""
     job_id: str = ""
     test_id: str = ""
-    test_timestamp: datetime = field(default_factory=datetime.utcnow)
+    test_timestamp: str = field(default_factory=utc_now_iso)  # ISO 8601, UTC
     
     # Scores
     total_score: float = 0.0  # [0.0-1.0]
@@ -285,7 +307,7 @@ class TestResult:
             "candidate_id": self.candidate_id,
             "job_id": self.job_id,
             "test_id": self.test_id,
-            "test_timestamp": self.test_timestamp.isoformat(),
+            "test_timestamp": self.test_timestamp,
             "total_score": self.total_score,
             "questions_attempted": self.questions_attempted,
             "questions_correct": self.questions_correct,
@@ -297,8 +319,13 @@ class TestResult:
             "integrity_flags": self.integrity_flags,
         }
 
+    @property
+    def test_datetime(self) -> datetime:
+        """test_timestamp parsed, for code that needs datetime arithmetic."""
+        return datetime.fromisoformat(self.test_timestamp)
+
 
-@dataclass
+@dataclass(slots=True)
 class FinalRanking:
     """
     Final ranking for a candidate after all evaluation stages.
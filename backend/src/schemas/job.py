@@ -6,7 +6,7 @@ their parsed representations.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
@@ -84,7 +84,7 @@ class JobDescription:
     raw_description: str = ""
     experience_years_min: int = 0
     experience_years_max: int = 20
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     created_by: str = ""  # Hiring manager ID
     
     # Hiring parameters
@@ -123,7 +123,7 @@ class ParsedJD:
     This is what the JD Analyzer agent produces from raw job descriptions.
     """
     job_id: str = ""
-    parsing_timestamp: datetime = field(default_factory=datetime.utcnow)
+    parsing_timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     parsing_confidence: float = 0.0
     
     # Core information
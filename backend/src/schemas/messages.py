@@ -6,7 +6,7 @@ This ensures consistency, traceability, and framework-agnostic operation.
 """
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
@@ -50,7 +50,7 @@ class AgentMessage:
     source_agent: str = ""
     target_agent: str = ""
     correlation_id: str = ""  # Links related messages across the pipeline
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     payload: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
@@ -185,13 +185,17 @@ class PipelineState:
     pipeline_id: str = field(default_factory=lambda: uuid4().hex)
     job_id: str = ""
     current_stage: PipelineStage = PipelineStage.INITIALIZED
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     
     # Accumulated data from each stage
-    job_description: Dict[str, Any] = field(default_factory=dict)
+    job_description: Any = field(default_factory=dict)  # JobDescription or its dict form
     parsed_jd: Dict[str, Any] = field(default_factory=dict)
     candidates: List[Dict[str, Any]] = field(default_factory=list)
+    # Typed profiles handed to create_pipeline. Converted to `candidates`
+    # dicts on first need by materialize_candidates(); candidate dicts
+    # assigned directly take precedence.
+    candidate_profiles: List[Any] = field(default_factory=list, repr=False)
     match_results: List[Dict[str, Any]] = field(default_factory=list)
     shortlisted_candidates: List[str] = field(default_factory=list)
     test_questions: List[Dict[str, Any]] = field(default_factory=list)
@@ -212,15 +216,18 @@ class PipelineState:
     warnings: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
+        job_description = self.job_description
+        if hasattr(job_description, "to_dict"):
+            job_description = job_description.to_dict()
         return {
             "pipeline_id": self.pipeline_id,
             "job_id": self.job_id,
             "current_stage": self.current_stage.value,
             "created_at": self.created_at.isoformat(),
             "updated_at": self.updated_at.isoformat(),
-            "job_description": self.job_description,
+            "job_description": job_description,
             "parsed_jd": self.parsed_jd,
-            "candidates": self.candidates,
+            "candidates": self.materialize_candidates(),
             "match_results": self.match_results,
             "shortlisted_candidates": self.shortlisted_candidates,
             "test_questions": self.test_questions,
@@ -235,12 +242,20 @@ class PipelineState:
             "warnings": self.warnings,
         }
 
+    def materialize_candidates(self) -> List[Dict[str, Any]]:
+        """Return candidate dicts, converting pending candidate_profiles once."""
+        if self.candidate_profiles:
+            if not self.candidates:
+                self.candidates = [p.to_dict() for p in self.candidate_profiles]
+            self.candidate_profiles = []
+        return self.candidates
+
     def add_agent_response(self, response: Dict[str, Any]) -> None:
         """Record an agent's response to the pipeline history."""
         self.agent_responses.append(response)
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
 
     def add_decision_gate(self, gate: DecisionGate) -> None:
         """Record a decision gate evaluation."""
         self.decision_gates.append(gate.to_dict())
-        self.updated_at = datetime.utcnow()
+        self.updated_at = datetime.now(timezone.utc)
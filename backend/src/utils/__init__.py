@@ -5,10 +5,15 @@ from .pdf_extractor import (
     extract_resume_sections,
     PDFExtractionResult,
 )
+from .timestamps import from_ts_ms, iso_timestamps, to_ts_ms, utc_now_iso
 
 __all__ = [
     "extract_text_from_pdf",
     "validate_pdf_file", 
     "extract_resume_sections",
     "PDFExtractionResult",
+    "utc_now_iso",
+    "to_ts_ms",
+    "from_ts_ms",
+    "iso_timestamps",
 ]
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+Timestamp helpers.
+
+Formatting the current time is surprisingly hot when results and audit
+events are produced in bursts, so the formatted string is shared by every
+caller within the same millisecond.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MS = timedelta(milliseconds=1)
+
+# (epoch milliseconds, ISO string) of the last timestamp formatted. Swapped
+# as one tuple so concurrent callers never see a mismatched pair.
+_ts_cache = (0, "")
+
+
+def utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string at millisecond precision."""
+    global _ts_cache
+    ms = time.time_ns() // 1_000_000
+    cached_ms, cached = _ts_cache
+    if ms != cached_ms:
+        cached = from_ts_ms(ms)
+        _ts_cache = (ms, cached)
+    return cached
+
+
+def to_ts_ms(dt: datetime) -> int:
+    """Epoch milliseconds for a datetime; naive datetimes are taken as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_MS
+
+
+def from_ts_ms(ms: int) -> str:
+    """ISO 8601 UTC string for epoch milliseconds, for API responses."""
+    return datetime.fromtimestamp(ms / 1000, timezone.utc).isoformat(timespec="milliseconds")
+
+
+# Epoch-ms fields emitted by the schema to_dict() methods, and the ISO key
+# each one is served under by the API
+_MS_FIELDS = {
+    "application_date_ms": "application_date",
+    "consent_timestamp_ms": "consent_timestamp",
+    "parsing_timestamp_ms": "parsing_timestamp",
+}
+
+
+def iso_timestamps(obj):
+    """
+    Copy of a to_dict() tree with epoch-ms fields replaced by ISO strings.
+    
+    The pipeline keeps timestamps as integers internally; every API
+    response carrying state or candidates goes through this once, so the
+    wire format matches the ISO timestamps used by the job schemas.
+    """
+    if isinstance(obj, dict):
+        converted = {}
+        for key, value in obj.items():
+            iso_key = _MS_FIELDS.get(key)
+            if iso_key is not None:
+                converted[iso_key] = from_ts_ms(value) if value is not None else None
+            else:
+                converted[key] = iso_timestamps(value)
+        return converted
+    if isinstance(obj, list):
+        return [iso_timestamps(item) for item in obj]
+    return obj
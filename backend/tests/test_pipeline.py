@@ -13,7 +13,7 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.agents.orchestrator import OrchestratorAgent
-from src.agents.jd_analyzer import JDAnalyzerAgent
+from src.agents.jd_analyzer import NUMPY_AVAILABLE, JDAnalyzerAgent, JDExtractionCache
 from src.agents.resume_parser import ResumeParserAgent
 from src.agents.matcher import MatcherAgent, MatcherInput
 from src.agents.test_generator import TestGeneratorAgent, TestGeneratorInput
@@ -123,6 +123,76 @@ def test_jd_analyzer():
     return response.status.value == "success"
 
 
+def test_jd_extraction_cache():
+    """Test exact hits, semantic hits and auto-disable of the JD extraction cache."""
+    print("\n" + "="*60)
+    print("Testing JD Extraction Cache")
+    print("="*60)
+    
+    model = "test-model"
+    jds = [
+        JobDescription(job_id=f"job_{i}", title="Engineer", raw_description=text)
+        for i, text in enumerate([
+            "python django postgres",
+            "python django postgres aws",
+            "java spring kafka",
+        ])
+    ]
+    
+    # Exact layer, bounded by max_entries
+    cache = JDExtractionCache(max_entries=2)
+    cache.semantic_enabled = False
+    for jd in jds:
+        key, embedding, hit = cache.lookup(jd, model)
+        if hit is not None:
+            print("Unexpected hit on first lookup")
+            return False
+        cache.store(key, embedding, model, jd.job_id, {"skills": [jd.job_id]})
+    evicted = cache.lookup(jds[0], model)[2]
+    exact = cache.lookup(jds[2], model)[2]
+    print(f"Exact: evicted={evicted} hit={exact} hit_rate={cache.hit_rate:.2f}")
+    if evicted is not None or exact != ("job_2", {"skills": ["job_2"]}):
+        return False
+    
+    if not NUMPY_AVAILABLE:
+        print("NumPy not installed; skipping semantic layer")
+        return True
+    import numpy as np
+    
+    class BagOfWords:
+        vocab = ["python", "django", "postgres", "aws", "java", "spring", "kafka", "go"]
+        
+        def encode(self, text, convert_to_numpy=True):
+            words = text.split()
+            return np.array([words.count(w) for w in self.vocab], dtype=np.float64)
+    
+    # Semantic layer; a semantic hit is promoted to the exact layer without
+    # growing it past max_entries
+    cache = JDExtractionCache(max_entries=1, similarity_threshold=0.85)
+    cache.semantic_enabled = True
+    cache._embedding_model = BagOfWords()
+    key, embedding, _ = cache.lookup(jds[0], model)
+    cache.store(key, embedding, model, jds[0].job_id, {"skills": ["python"]})
+    semantic = cache.lookup(jds[1], model)[2]
+    print(f"Semantic: hit={semantic} exact_entries={len(cache._exact)}")
+    if semantic != ("job_0", {"skills": ["python"]}) or len(cache._exact) > 1:
+        return False
+    if cache.lookup(jds[1], model)[2] is None or cache.semantic_lookups != 2:
+        return False
+    
+    # Auto-disable once the semantic hit rate stays below min_hit_rate
+    cache = JDExtractionCache(min_lookups=3, min_hit_rate=0.5)
+    cache.semantic_enabled = True
+    cache._embedding_model = BagOfWords()
+    for i, text in enumerate(["python", "java", "go", "kafka"]):
+        jd = JobDescription(job_id=f"job_{i}", title="Engineer", raw_description=text)
+        key, embedding, _ = cache.lookup(jd, model)
+        cache.store(key, embedding, model, jd.job_id, {})
+    print(f"Auto-disable: semantic_enabled={cache.semantic_enabled} "
+          f"semantic_lookups={cache.semantic_lookups}")
+    return not cache.semantic_enabled and cache.semantic_lookups == 3
+
+
 def test_resume_parser():
     """Test the Resume Parser agent."""
     print("\n" + "="*60)
@@ -151,6 +221,46 @@ def test_resume_parser():
     return response.status.value == "success"
 
 
+def test_resume_parser_cache():
+    """Test that repeated resumes are served from the parse cache per candidate."""
+    print("\n" + "="*60)
+    print("Testing Resume Parser Cache")
+    print("="*60)
+    
+    import time
+    
+    def parse(candidate_id):
+        return {"candidate_id": candidate_id, "resume_text": SAMPLE_RESUME, "resume_format": "txt"}
+    
+    def cache_hit(response):
+        return any("already parsed" in step[1] for step in response.audit_trail.steps)
+    
+    agent = ResumeParserAgent()
+    first = agent.run(parse("candidate_001")).response
+    time.sleep(0.002)
+    repeat = agent.run(parse("candidate_002")).response
+    time.sleep(0.002)
+    batch = [r.response for r in agent.run_batch([
+        parse("candidate_003"), parse("candidate_004"),
+    ])]
+    
+    hits = [cache_hit(r) for r in [first, repeat, *batch]]
+    print(f"Cache hits: {hits}")
+    if hits != [False, True, True, True]:
+        return False
+    
+    # A hit is re-attributed to its own candidate and parse time
+    outputs = [first.output, repeat.output, *(r.output for r in batch)]
+    ids = [o.candidate_id for o in outputs]
+    timestamps = [o.parsing_timestamp for o in outputs]
+    print(f"Candidates: {ids}")
+    return (
+        ids == ["candidate_001", "candidate_002", "candidate_003", "candidate_004"]
+        and timestamps[0] < timestamps[1] < timestamps[2] <= timestamps[3]
+        and all(o.skills == first.output.skills for o in outputs)
+    )
+
+
 def test_matcher():
     """Test the Matcher agent."""
     print("\n" + "="*60)
@@ -202,6 +312,66 @@ def test_matcher():
     return response.status.value == "success"
 
 
+def test_matcher_batch():
+    """Test that batch matching agrees with per-candidate matching."""
+    print("\n" + "="*60)
+    print("Testing Matcher Batch Scoring")
+    print("="*60)
+    
+    jd = JDAnalyzerAgent().run(JobDescription(
+        job_id="test_job_001",
+        title="Senior Python Developer",
+        raw_description=SAMPLE_JD,
+    )).response.output
+    
+    resume_agent = ResumeParserAgent()
+    resumes = [
+        resume_agent.run({
+            "candidate_id": f"candidate_{i:03d}",
+            "resume_text": text,
+            "resume_format": "txt",
+        }).response.output
+        for i, text in enumerate([SAMPLE_RESUME, SAMPLE_RESUME.replace("Python", "Java")])
+    ]
+    
+    if not jd or not all(resumes):
+        print("Could not parse JD or resumes")
+        return False
+    
+    matcher = MatcherAgent()
+    batch = matcher.match_batch(resumes, jd)
+    single = [
+        matcher.run(MatcherInput(r.candidate_id, r, jd)).response.output
+        for r in resumes
+    ]
+    
+    batch_responses = [
+        r.response for r in matcher.run_batch([MatcherInput(r.candidate_id, r, jd) for r in resumes])
+    ]
+    
+    for b, s in zip(batch, single, strict=True):
+        print(f"{b.candidate_id}: batch={b.overall_match_score:.4f} single={s.overall_match_score:.4f}")
+    
+    # run_batch() scores the same way and keeps per-candidate responses
+    single_responses = [
+        matcher.run(MatcherInput(r.candidate_id, r, jd)).response for r in resumes
+    ]
+    for b, s in zip(batch_responses, single_responses, strict=True):
+        if (abs(b.output.overall_match_score - s.output.overall_match_score) > 1e-9
+                or b.confidence_score != s.confidence_score
+                or b.explanation != s.explanation
+                or len(b.audit_trail.steps) != len(s.audit_trail.steps)):
+            print(f"run_batch response differs for {b.output.candidate_id}")
+            return False
+    
+    return all(
+        abs(b.overall_match_score - s.overall_match_score) < 1e-9
+        and b.required_skills_met == s.required_skills_met
+        and b.strengths == s.strengths
+        for b, s in zip(batch, single, strict=True)
+    )
+
+
 def test_test_generator():
     """Test the Test Generator agent."""
     print("\n" + "="*60)
@@ -567,9 +737,342 @@ def test_bias_auditor():
         if response.output.recommendations:
             print(f"Recommendations: {response.output.recommendations[:2]}")
     
+    # Precomputed columns may be plain lists; they must audit the same way
+    supplied = auditor.run(BiasAuditInput(
+        pipeline_state=state,
+        rankings=rankings,
+        scores_array=[r.final_composite_score for r in rankings],
+        explanation_lens=[len(r.ranking_explanation) for r in rankings],
+    )).response
+    if supplied.explanation != response.explanation:
+        print(f"Supplied columns changed the audit: {supplied.explanation}")
+        return False
+    
     return response.status.value == "success"
 
 
+def test_api_timestamps():
+    """Test that state and candidate responses carry ISO timestamps, not epoch ms."""
+    print("\n" + "="*60)
+    print("Testing API Timestamp Shape")
+    print("="*60)
+    
+    from datetime import datetime, timezone
+    from src.utils.timestamps import iso_timestamps
+    
+    def timestamp_fields(obj, found):
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                if key.endswith(("_timestamp", "_date", "_timestamp_ms", "_date_ms")):
+                    found.append((key, value))
+                timestamp_fields(value, found)
+        elif isinstance(obj, list):
+            for item in obj:
+                timestamp_fields(item, found)
+        return found
+    
+    def iso_only(response):
+        fields = timestamp_fields(response, [])
+        return bool(fields) and all(
+            not key.endswith("_ms")
+            and (value is None or datetime.fromisoformat(value).tzinfo is not None)
+            for key, value in fields
+        )
+    
+    consent = datetime(2024, 5, 1, 9, 30, 15, 250000, tzinfo=timezone.utc)
+    orchestrator = OrchestratorAgent()
+    state = orchestrator.create_pipeline(
+        JobDescription(job_id="test_job_001", title="Senior Python Developer", raw_description=SAMPLE_JD),
+        [CandidateProfile(candidate_id="candidate_001", data_consent_given=True, consent_timestamp=consent)],
+    )
+    resume = ResumeParserAgent().run({
+        "candidate_id": "candidate_001",
+        "resume_text": SAMPLE_RESUME,
+        "resume_format": "txt",
+    }).response.output
+    state_dict = state.to_dict()
+    state_dict["candidates"][0]["parsed_resume"] = resume.to_dict()
+    
+    # GET /api/pipelines/{id} and GET /api/pipelines/{id}/candidate/{cid}
+    pipeline_response = iso_timestamps({"pipeline_id": state.pipeline_id, "state": state_dict})
+    candidate = pipeline_response["state"]["candidates"][0]
+    candidate_response = iso_timestamps({
+        "candidate_id": "candidate_001",
+        "parsed_resume": state_dict["candidates"][0]["parsed_resume"],
+    })
+    print(f"Pipeline timestamps: {timestamp_fields(pipeline_response, [])}")
+    if not (iso_only(pipeline_response) and iso_only(candidate_response)):
+        return False
+    if candidate["consent_timestamp"] != "2024-05-01T09:30:15.250+00:00":
+        return False
+    
+    try:
+        from fastapi.testclient import TestClient
+        from src.api.main import app
+    except ImportError:
+        print("FastAPI not installed; skipping live endpoint check")
+        return True
+    
+    # Same shapes from the running app
+    client = TestClient(app)
+    job_id = client.post("/api/jobs", json={
+        "title": "Senior Python Developer", "raw_description": SAMPLE_JD,
+    }).json()["job_id"]
+    candidate_id = client.post(f"/api/jobs/{job_id}/candidates", json={
+        "resume_text": SAMPLE_RESUME,
+    }).json()["candidate_id"]
+    pipeline_id = client.post("/api/pipelines", json={"job_id": job_id}).json()["pipeline_id"]
+    client.post(f"/api/pipelines/{pipeline_id}/run")
+    responses = [
+        client.get(f"/api/pipelines/{pipeline_id}").json(),
+        client.get(f"/api/pipelines/{pipeline_id}/candidate/{candidate_id}").json(),
+    ]
+    return all(iso_only(r) for r in responses)
+
+
+def test_audit_logger_writer():
+    """Test flushing, closing with queued entries, and collection of the audit writer."""
+    print("\n" + "="*60)
+    print("Testing Audit Logger Writer")
+    print("="*60)
+    
+    import gc
+    import tempfile
+    from src.core.logger import AuditLogger, ComplianceReader
+    
+    def log_events(logger, count, pipeline_id="pipeline_001"):
+        logger.log_many([
+            {"event_type": "decision", "action": f"action_{i}", "details": {"i": i},
+             "pipeline_id": pipeline_id}
+            for i in range(count)
+        ])
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "audit.jsonl")
+        logger = AuditLogger(path)
+        
+        log_events(logger, 300)
+        logger.flush()
+        after_flush = sum(1 for _ in ComplianceReader(path).records())
+        
+        log_events(logger, 200)
+        waited = logger.flush_and_wait(timeout=5.0)
+        after_wait = sum(1 for _ in ComplianceReader(path).records())
+        
+        # Entries still queued when close() is called are written
+        for _ in range(20):
+            log_events(logger, 50)
+        logger.close()
+        after_close = sum(1 for _ in ComplianceReader(path).records())
+        try:
+            logger.log("decision", "late", {})
+            rejected_after_close = False
+        except ValueError:
+            rejected_after_close = True
+        
+        print(f"flush={after_flush} flush_and_wait={after_wait} ({waited}) "
+              f"close={after_close} rejected_after_close={rejected_after_close}")
+        if (after_flush, after_wait, after_close) != (300, 500, 1500) or not (waited and rejected_after_close):
+            return False
+        
+        # A dropped logger is collected, and its writer drains and stops
+        dropped_path = os.path.join(tmp, "dropped.jsonl")
+        dropped = AuditLogger(dropped_path)
+        writer = dropped._writer._thread
+        log_events(dropped, 100)
+        del dropped
+        gc.collect()
+        writer.join(timeout=5.0)
+        dropped_written = sum(1 for _ in ComplianceReader(dropped_path).records())
+        print(f"Dropped logger: writer_alive={writer.is_alive()} written={dropped_written}")
+        if writer.is_alive() or dropped_written != 100:
+            return False
+        
+        # Inline writes, fsynced every few entries
+        inline_path = os.path.join(tmp, "inline.jsonl")
+        with AuditLogger(inline_path, background=False, fsync_every=4) as inline:
+            for i in range(10):
+                inline.log("decision", f"action_{i}", {"i": i})
+            unsynced = inline._file._unsynced
+        inline_written = sum(1 for _ in ComplianceReader(inline_path).records())
+        print(f"Inline: written={inline_written} unsynced_before_close={unsynced}")
+        if inline_written != 10 or unsynced != 2:
+            return False
+        
+        # A write error stops the writer and surfaces on the next call
+        # instead of queueing entries nobody will write
+        failing = AuditLogger(os.path.join(tmp, "failing.jsonl"))
+        read_only = os.open(failing.log_path, os.O_RDONLY)
+        os.dup2(read_only, failing._file._fd)
+        os.close(read_only)
+        failing.log("decision", "lost", {})
+        outcomes = {}
+        for name, call in (
+            ("flush_and_wait", lambda: failing.flush_and_wait(timeout=5.0)),
+            ("flush", failing.flush),
+            ("log", lambda: failing.log("decision", "late", {})),
+        ):
+            try:
+                call()
+                outcomes[name] = "returned"
+            except RuntimeError as exc:
+                outcomes[name] = type(exc.__cause__).__name__
+        failing.close()
+        
+        # close() tolerates a descriptor that is already gone
+        broken = AuditLogger(os.path.join(tmp, "broken.jsonl"), background=False, fsync_every=1)
+        os.close(broken._file._fd)
+        try:
+            broken.close()
+            outcomes["close"] = "returned"
+        except OSError:
+            outcomes["close"] = "raised"
+        print(f"Failing writer: {outcomes}")
+        return outcomes == {
+            "flush_and_wait": "OSError", "flush": "OSError", "log": "OSError", "close": "returned",
+        }
+
+
+def test_audit_logger_queries():
+    """Test in-memory eviction, filtering, pooling and replay of the audit log."""
+    print("\n" + "="*60)
+    print("Testing Audit Logger Queries")
+    print("="*60)
+    
+    import tempfile
+    from src.core.logger import MSGPACK_AVAILABLE, AuditLogger, ComplianceReader
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Overflow max_in_memory; every index must match a scan of what is left
+        path = os.path.join(tmp, "audit.jsonl")
+        logger = AuditLogger(path, max_in_memory=10)
+        logged = [
+            logger.log(
+                event_type=("decision", "error", "decision_gate")[i % 3],
+                action=f"action_{i}",
+                details={"i": i},
+                pipeline_id=f"pipeline_{i % 2}" if i % 5 else None,
+                requires_review=i % 4 == 0,
+            )
+            for i in range(25)
+        ]
+        recent = logged[-10:]
+        expected = {
+            "pipeline_0": [e for e in recent if e.pipeline_id == "pipeline_0"],
+            "pipeline_1": [e for e in recent if e.pipeline_id == "pipeline_1"],
+            "decision": [e for e in recent if e.event_type == "decision"],
+            "error": [e for e in recent if e.event_type == "error"],
+            "review": [e for e in recent if e.requires_review],
+        }
+        actual = {
+            "pipeline_0": logger.get_entries(pipeline_id="pipeline_0"),
+            "pipeline_1": logger.get_entries(pipeline_id="pipeline_1"),
+            "decision": logger.get_entries(event_type="decision"),
+            "error": logger.get_entries(event_type="error"),
+            "review": logger.get_review_queue(),
+        }
+        for name in expected:
+            print(f"{name}: {len(actual[name])} entries (expected {len(expected[name])})")
+        if actual != expected or logger.get_entries() != recent:
+            return False
+        if logger.get_entries(requires_review=True) != expected["review"]:
+            return False
+        if logger.get_entries(pipeline_id="pipeline_0", event_type="error") != [
+            e for e in expected["pipeline_0"] if e.event_type == "error"
+        ]:
+            return False
+        
+        # The file keeps the full history; replay it and scan one pipeline
+        logger.close()
+        replayed = list(AuditLogger.iter_entries(path))
+        pipeline_1 = list(ComplianceReader(path).entries("pipeline_1"))
+        print(f"Replayed {len(replayed)} entries, {len(pipeline_1)} for pipeline_1")
+        if [e.to_dict() for e in replayed] != [e.to_dict() for e in logged]:
+            return False
+        if [e.entry_id for e in pipeline_1] != [e.entry_id for e in logged if e.pipeline_id == "pipeline_1"]:
+            return False
+        
+        # Filtering and sampling; review events are always kept
+        filtered = AuditLogger(os.path.join(tmp, "filtered.jsonl"), enabled_events={"decision_gate"})
+        sampled = AuditLogger(os.path.join(tmp, "sampled.jsonl"), sample_rate=0.0)
+        outcomes = [
+            filtered.log_decision("matcher", "match", 0.9, "confident") is None,
+            filtered.log_decision("matcher", "match", 0.5, "unsure") is not None,
+            filtered.log_decision_gate("shortlist", True, 0.7, 0.9) is not None,
+            sampled.log("decision", "match", {}) is None,
+            sampled.log_human_review_request("low confidence", {}) is not None,
+        ]
+        filtered.close()
+        sampled.close()
+        print(f"Filtering/sampling outcomes: {outcomes}")
+        if not all(outcomes):
+            return False
+        
+        # Without retention, written entries are recycled through the pool
+        pooled = AuditLogger(os.path.join(tmp, "pooled.jsonl"), retain_entries=False, pool_size=4)
+        reused = {id(pooled.log("decision", f"action_{i}", {})) for i in range(10)}
+        pooled.close()
+        print(f"Pooled: distinct entry objects={len(reused)} retained={len(pooled.get_entries())}")
+        if len(reused) != 1 or pooled.get_entries():
+            return False
+        
+        # msgpack framing round trip, or the JSONL fallback without msgpack
+        packed_path = os.path.join(tmp, "audit.msgpack")
+        with AuditLogger(packed_path, serializer="msgpack") as packed:
+            packed_logged = [packed.log("decision", f"action_{i}", {"i": i}).to_dict() for i in range(5)]
+        replayed = [e.to_dict() for e in AuditLogger.iter_entries(packed_path, packed.serializer)]
+        print(f"Serializer: {packed.serializer} (msgpack installed: {MSGPACK_AVAILABLE})")
+        return replayed == packed_logged and packed.serializer == ("msgpack" if MSGPACK_AVAILABLE else "json")
+
+
+def test_jsonl_writer():
+    """Test JSONLWriter flushing, and that a failed writer stops instead of hanging."""
+    print("\n" + "="*60)
+    print("Testing JSONL Writer")
+    print("="*60)
+    
+    import json
+    import tempfile
+    import threading
+    from src.core.logger import JSONLWriter
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "events.jsonl")
+        writer = JSONLWriter(path, batch_size=8)
+        for i in range(20):
+            writer.append({"i": i})
+        writer.flush()
+        with open(path) as f:
+            written = [json.loads(line)["i"] for line in f]
+        writer.close()
+        print(f"Written: {len(written)} records")
+        if written != list(range(20)):
+            return False
+        
+        failing = JSONLWriter(os.path.join(tmp, "failing.jsonl"), render=lambda r: 1 / 0)
+        failing.append({"i": 0})
+        outcome = {}
+        
+        def flush():
+            try:
+                failing.flush()
+                outcome["flush"] = "returned"
+            except RuntimeError as exc:
+                outcome["flush"] = type(exc.__cause__).__name__
+        
+        flusher = threading.Thread(target=flush, daemon=True)
+        flusher.start()
+        flusher.join(timeout=5.0)
+        try:
+            failing.append({"i": 1})
+            outcome["append"] = "accepted"
+        except RuntimeError:
+            outcome["append"] = "rejected"
+        failing.close()
+        print(f"Failing render: {outcome}")
+        return outcome == {"flush": "ZeroDivisionError", "append": "rejected"}
+
+
 def main():
     """Run all tests."""
     print("\n" + "="*60)
@@ -578,13 +1081,20 @@ def main():
     
     results = {
         "JD Analyzer": test_jd_analyzer(),
+        "JD Extraction Cache": test_jd_extraction_cache(),
         "Resume Parser": test_resume_parser(),
+        "Resume Parser Cache": test_resume_parser_cache(),
         "Matcher": test_matcher(),
+        "Matcher Batch": test_matcher_batch(),
         "Test Generator": test_test_generator(),
         "Shortlister": test_shortlister(),
         "Test Evaluator": test_test_evaluator(),
         "Ranker": test_ranker(),
         "Bias Auditor": test_bias_auditor(),
+        "API Timestamps": test_api_timestamps(),
+        "JSONL Writer": test_jsonl_writer(),
+        "Audit Logger Writer": test_audit_logger_writer(),
+        "Audit Logger Queries": test_audit_logger_queries(),
     }
     
     print("\n" + "="*60)